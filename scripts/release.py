@@ -9,32 +9,50 @@ import sys
 import subprocess
 from pathlib import Path
 
+if sys.version_info >= (3, 11):  # noqa: UP036 - requires-python is >=3.10
+    import tomllib
+else:  # Python 3.10: tomli comes with the dev extra
+    import tomli as tomllib
+
+# Version line and table headers, used to rewrite only [project].version
+VERSION_LINE_RE = re.compile(r'^version\s*=\s*"[^"]+"', re.MULTILINE)
+TABLE_HEADER_RE = re.compile(r'^\[[^\]]+\]', re.MULTILINE)
+PROJECT_HEADER_RE = re.compile(r'^\[project\]', re.MULTILINE)
+
 def get_current_version():
     """Get current version from pyproject.toml"""
     pyproject_path = Path("pyproject.toml")
     if not pyproject_path.exists():
         raise FileNotFoundError("pyproject.toml not found")
     
-    content = pyproject_path.read_text()
-    match = re.search(r'version = "([^"]+)"', content)
-    if not match:
+    data = tomllib.loads(pyproject_path.read_text())
+    version = data.get("project", {}).get("version")
+    if not version:
         raise ValueError("Could not find version in pyproject.toml")
     
-    return match.group(1)
+    return version
 
 def update_version(new_version):
     """Update version in pyproject.toml"""
     pyproject_path = Path("pyproject.toml")
     content = pyproject_path.read_text()
     
-    # Replace version line
-    new_content = re.sub(
-        r'version = "[^"]+"',
+    # Replace the version line inside [project] only, leaving any other
+    # table's version keys untouched
+    header = PROJECT_HEADER_RE.search(content)
+    if not header:
+        raise ValueError("Could not find [project] table in pyproject.toml")
+    next_header = TABLE_HEADER_RE.search(content, header.end())
+    end = next_header.start() if next_header else len(content)
+    section, count = VERSION_LINE_RE.subn(
         f'version = "{new_version}"',
-        content
+        content[header.end():end],
+        count=1
     )
+    if not count:
+        raise ValueError("Could not find version in pyproject.toml")
     
-    pyproject_path.write_text(new_content)
+    pyproject_path.write_text(content[:header.end()] + section + content[end:])
     print(f"✅ Updated version to {new_version} in pyproject.toml")
 
 def bump_version(current_version, bump_type):
@@ -63,24 +81,29 @@ def create_git_tag(version):
     """Create git tag and push to remote"""
     tag_name = f"v{version}"
     
-    # Check if tag already exists
+    # Check if tag already exists (exit code only, no listing)
     result = subprocess.run(
-        ["git", "tag", "-l", tag_name],
+        ["git", "rev-parse", "-q", "--verify", f"refs/tags/{tag_name}"],
         capture_output=True,
         text=True
     )
-    
-    if tag_name in result.stdout:
+
+    if result.returncode == 0:
         print(f"⚠️  Tag {tag_name} already exists")
         return False
-    
-    # Create and push tag
-    subprocess.run(["git", "add", "pyproject.toml"], check=True)
-    subprocess.run(["git", "commit", "-m", f"Bump version to {version}"], check=True)
+
+    # Commit only pyproject.toml (pathspec stages it), tag, then push branch
+    # and tag together in one atomic round trip to origin
+    subprocess.run(
+        ["git", "commit", "-m", f"Bump version to {version}", "--", "pyproject.toml"],
+        check=True
+    )
     subprocess.run(["git", "tag", "-a", tag_name, "-m", f"Release {version}"], check=True)
-    subprocess.run(["git", "push", "origin", "main"], check=True)
-    subprocess.run(["git", "push", "origin", tag_name], check=True)
-    
+    subprocess.run(
+        ["git", "push", "--atomic", "origin", "main", f"refs/tags/{tag_name}"],
+        check=True
+    )
+
     print(f"✅ Created and pushed tag {tag_name}")
     return True
 
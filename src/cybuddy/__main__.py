@@ -1,13 +1,24 @@
-import asyncio
-from .tui import SimpleTUI
-
 def run():
-    """Entry point for the cybuddy command."""
+    """Entry point for the cybuddy command.
+
+    When called from code that already runs an event loop (e.g. IPython),
+    the TUI is scheduled on that loop and the task is returned to await.
+    """
+    import asyncio
+
+    from .tui import SimpleTUI
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        return loop.create_task(SimpleTUI().run())
+
     try:
         asyncio.run(SimpleTUI().run())
     except KeyboardInterrupt:
-        print("\nGood luck! Document your steps and be safe.")
+        pass  # Ctrl-C cancelled the TUI task, which already said goodbye
 
 if __name__ == "__main__":
     run()
-
@@ -0,0 +1,28 @@
+"""JSON-lines encoding shared by the session log and the command history.
+
+Uses orjson when installed; output matches the stdlib fallback. Lines are
+produced as UTF-8 bytes for appending in binary mode, and loads accepts
+bytes directly.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    def dumpb(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def dumpb(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    loads = json.loads
+    ORJSON_AVAILABLE = False
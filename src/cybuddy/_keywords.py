@@ -0,0 +1,43 @@
+"""Substring keyword tables compiled into a single regex scan.
+
+A table maps each label to keywords that count as present when they occur
+anywhere in the (already lowercased) text. The keywords are compiled into one
+lookahead alternation, so ``finditer`` checks every position once. At each
+position only the first label with a matching keyword is reported, so no
+keyword may be a prefix of another label's keyword: "scan" under one label
+and "scanner" under a later one would hide the later label.
+``compile_keyword_table`` rejects such tables.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+
+def compile_keyword_table(table: Mapping[str, Iterable[str]]) -> re.Pattern[str]:
+    """Compile a label -> keywords table into one lookahead alternation."""
+    labels = [(label, tuple(keywords)) for label, keywords in table.items()]
+    for label, keywords in labels:
+        for other, other_keywords in labels:
+            if other == label:
+                continue
+            for keyword in keywords:
+                clash = next((k for k in other_keywords if k.startswith(keyword)), None)
+                if clash is not None:
+                    raise ValueError(
+                        f"keyword {keyword!r} ({label}) is a prefix of "
+                        f"{clash!r} ({other})"
+                    )
+    groups = "|".join(
+        f"(?P<{label}>" + "|".join(map(re.escape, keywords)) + ")"
+        for label, keywords in labels
+    )
+    return re.compile(f"(?=(?:{groups}))")
+
+
+def find_labels(pattern: re.Pattern[str], text: str) -> frozenset[str]:
+    """Return the labels of a compiled table whose keywords occur in text."""
+    return frozenset(
+        m.lastgroup for m in pattern.finditer(text) if m.lastgroup is not None
+    )
@@ -1,37 +1,50 @@
 from __future__ import annotations
 
-import json
+import atexit
 import os
-from datetime import datetime
+import time
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Any, BinaryIO
+
+from ._json import dumpb
 
 # === Student-focused helpers (uses rich mockup data) ===
 
+# data.py holds the large response tables, so it is imported on first use.
+# The tables are static, so helper results are memoized per argument.
+
+@lru_cache(maxsize=256)
 def explain_command(command_text: str) -> str:
     from .data import smart_explain
     return smart_explain(command_text)
 
 
+@lru_cache(maxsize=256)
 def quick_tip(topic: str) -> str:
     from .data import smart_tip
     return smart_tip(topic)
 
 
+@lru_cache(maxsize=256)
 def help_troubleshoot(issue: str) -> str:
     from .data import smart_assist
     return smart_assist(issue)
 
 
+@lru_cache(maxsize=256)
 def micro_report(finding: str) -> str:
     from .data import smart_report
     return smart_report(finding)
 
 
+@lru_cache(maxsize=256)
 def quiz_flashcards(topic: str) -> str:
     from .data import smart_quiz
     return smart_quiz(topic)
 
 
+@lru_cache(maxsize=256)
 def step_planner(context: str) -> str:
     from .data import smart_plan
     return smart_plan(context)
@@ -39,37 +52,69 @@ def step_planner(context: str) -> str:
 
 # === Lightweight session history and TODO tracker ===
 
+@cache
 def _app_dir() -> Path:
-    # Respect HOME override; do not create directories unless needed later
+    # Respect HOME override; do not create directories unless needed later.
+    # Resolved once per process; _invalidate_config_cache() drops it.
     home = os.environ.get("HOME") or os.path.expanduser("~")
     return Path(home) / ".cybuddy"
 
 
+# Resolved history paths per session; each parent directory is created once
+_history_paths: dict[str | None, Path] = {}
+
+
 def _history_file(session: str | None = None) -> Path:
-    cfg = load_config()
+    path = _history_paths.get(session)
+    if path is not None:
+        return path
     if session:
         base = _app_dir() / "sessions" / session
         path = base / "history.jsonl"
     else:
+        cfg = load_config()
         path = Path(os.path.expanduser(cfg.get("history.path", str(_app_dir() / "history.jsonl"))))
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
     except Exception:
         pass
+    _history_paths[session] = path
     return path
 
 
 
 
+@cache
 def _config_file() -> Path:
     """Legacy config file path for backward compatibility."""
     return _app_dir() / "config.toml"
 
 
-def load_config() -> dict:
-    """Load configuration using the new config system."""
+# mtime of the config file the cached config and history paths came from
+_config_mtime_ns: int | None = -1
+
+
+def load_config() -> dict[str, Any]:
+    """Load configuration, re-parsing only when the config file changes."""
+    from .config import _config_path
+
+    global _config_mtime_ns
+    try:
+        mtime_ns: int | None = _config_path().stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns != _config_mtime_ns:
+        # history.path may have changed; resolve history files again
+        _history_paths.clear()
+        _config_mtime_ns = mtime_ns
+    return _load_config_cached(mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(mtime_ns: int | None) -> dict[str, Any]:
+    """Parse and flatten the config; cached per config file mtime."""
     from .config import load_config as load_new_config
-    
+
     # Load new config system
     new_config = load_new_config()
     
@@ -84,10 +129,75 @@ def load_config() -> dict:
     return cfg
 
 
+def _invalidate_config_cache() -> None:
+    """Drop the cached config and the paths derived from it."""
+    global _config_mtime_ns
+    _config_mtime_ns = -1
+    _load_config_cached.cache_clear()
+    _app_dir.cache_clear()
+    _config_file.cache_clear()
+    _history_paths.clear()
+
+
+
+
+# Last formatted timestamp; events within the same second reuse it
+_now_iso_sec = -1
+_now_iso_str = ""
 
 
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    global _now_iso_sec, _now_iso_str
+    sec = int(time.time())
+    if sec != _now_iso_sec:
+        _now_iso_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        _now_iso_sec = sec
+    return _now_iso_str
+
+
+class _HistorySink:
+    """Buffered append writers for history files, kept open per session.
+
+    Lines are flushed every ``FLUSH_EVERY`` writes and when the process exits,
+    so a session's events reach disk in batches instead of one write each.
+    """
+
+    FLUSH_EVERY = 16
+
+    def __init__(self) -> None:
+        self._handles: dict[Path, BinaryIO] = {}
+        self._pending = 0
+        atexit.register(self.close_all)
+
+    def write(self, path: Path, line: bytes) -> None:
+        fh = self._handles.get(path)
+        if fh is None:
+            fh = path.open("ab", buffering=8192)
+            self._handles[path] = fh
+        fh.write(line)
+        self._pending += 1
+        if self._pending >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        for fh in self._handles.values():
+            try:
+                fh.flush()
+            except Exception:
+                pass
+        self._pending = 0
+
+    def close_all(self) -> None:
+        for fh in self._handles.values():
+            try:
+                fh.close()
+            except Exception:
+                pass
+        self._handles.clear()
+        self._pending = 0
+
+
+_history_sink = _HistorySink()
 
 
 def history_append(event: dict, session: str | None = None) -> None:
@@ -96,12 +206,16 @@ def history_append(event: dict, session: str | None = None) -> None:
         return
     try:
         payload = {"ts": _now_iso(), **event}
-        with _history_file(session).open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload) + "\n")
+        _history_sink.write(_history_file(session), dumpb(payload) + b"\n")
     except Exception:
         pass
 
 
+def history_flush() -> None:
+    """Write out buffered history events, e.g. when a session ends."""
+    _history_sink.flush()
+
+
 
 
 
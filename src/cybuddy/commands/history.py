@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from ..history import clear_history, get_history, search_history
+from itertools import chain
+
+from ..history import SEARCH_LIMIT, clear_history, get_history, iter_search_history
 
 
 def cmd_history(args: list[str]) -> int:
@@ -37,8 +39,9 @@ def cmd_history(args: list[str]) -> int:
     
     if args[0] == "--search" and len(args) > 1:
         query = " ".join(args[1:])
-        results = search_history(query)
-        if not results:
+        results = iter_search_history(query, SEARCH_LIMIT + 1)
+        first = next(results, None)
+        if first is None:
             print(f"❌ No commands found matching '{query}'.")
             
             # Provide smart suggestions based on query
@@ -50,9 +53,12 @@ def cmd_history(args: list[str]) -> int:
                     print(f"  {i}. {suggestion}")
             return 0
         
-        print(f"🔍 Commands matching '{query}':")
-        for i, cmd in enumerate(results, 1):
-            print(f"{i:3d}. {cmd}")
+        print(f"🔍 Commands matching '{query}' (most recent first):")
+        for i, cmd in enumerate(chain((first,), results), 1):
+            if i > SEARCH_LIMIT:
+                print(f"... showing the {SEARCH_LIMIT} most recent matches")
+                break
+            print(f"{i:3d}. {cmd}", flush=True)
         return 0
     
     if args[0] == "--stats":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
 from typing import Any
@@ -93,7 +94,7 @@ def migrate_old_config() -> bool:
                             old_config[k] = v
             
             # Convert to new YAML format
-            new_config = DEFAULT_CONFIG.copy()
+            new_config = copy.deepcopy(DEFAULT_CONFIG)
             
             # Map old keys to new structure
             if old_config.get("output.truncate_lines"):
@@ -120,7 +121,7 @@ def load_config() -> dict[str, Any]:
         Configuration dictionary with user settings merged over defaults.
     """
     # Start with defaults
-    config = DEFAULT_CONFIG.copy()
+    config = copy.deepcopy(DEFAULT_CONFIG)
 
     # Try to migrate old config first
     migrate_old_config()
@@ -5,26 +5,23 @@ enabling realistic demonstrations without requiring AI API calls.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # ============================================================================
 # EXPLAIN DATABASE - 60+ tools and commands
 # ============================================================================
 
-EXPLAIN_DB: dict[str, dict[str, str]] = {
+_EXPLAIN_DB_RAW: dict[str, dict[str, str]] = {
     # Network Scanning
     "nmap": {
-        "base": "Network Mapper - powerful port scanner and service detection tool",
-        "-sV": "Version detection: probe open ports to determine service/version info",
-        "-sS": "SYN scan (stealth): send SYN packets without completing TCP handshake",
-        "-sT": "TCP connect scan: complete TCP handshake (more reliable, less stealth)",
-        "-sU": "UDP scan: check for open UDP ports (slow, often needs root)",
-        "-Pn": "Skip ping: treat all hosts as online (bypass ICMP filtering)",
-        "-A": "Aggressive scan: enables OS detection, version detection, script scanning, traceroute",
-        "-T": "Timing template: T0 (paranoid) to T5 (insane), affects scan speed",
-        "-p": "Port specification: -p 80,443 or -p- for all ports",
-        "--script": "Run NSE (Nmap Scripting Engine) scripts for advanced detection",
-        "-oN/-oX/-oG": "Output formats: normal, XML, greppable",
-        "usage": "Use for: Initial reconnaissance, service enumeration, vulnerability detection",
-        "caution": "Can trigger IDS/IPS. Start with -T2 or -T3 in shared environments"
+        "base": "Network mapper - port scanning and service detection",
+        "-sS": "TCP SYN scan (stealth scan)",
+        "-sV": "Service version detection",
+        "-O": "Operating system detection",
+        "-A": "Aggressive scan with OS detection, version detection, script scanning",
+        "usage": "Use for: Network reconnaissance, port scanning, service enumeration",
+        "caution": "Use responsibly. Some scans may be detected by IDS/IPS"
     },
 
     "masscan": {
@@ -38,37 +35,34 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Packet Analyzers
     "wireshark": {
-        "base": "World's most popular network protocol analyzer with GUI",
-        "-i": "Interface to capture on (e.g., -i eth0)",
-        "-f": "Capture filter (e.g., -f 'host 192.168.1.1')",
-        "-w": "Save to file (e.g., -w capture.pcap)",
-        "-r": "Read from file (e.g., -r capture.pcap)",
-        "usage": "Use for: Live packet capture, protocol analysis, network troubleshooting",
-        "caution": "Requires root/sudo for raw packet access. Can generate large files"
+        "base": "Network protocol analyzer - capture and analyze network traffic",
+        "capture": "Live packet capture from network interfaces",
+        "filters": "Display filters to focus on specific traffic",
+        "analysis": "Deep packet inspection and protocol analysis",
+        "usage": "Use for: Network troubleshooting, security analysis, protocol study",
+        "caution": "Can capture sensitive data. Ensure proper authorization and handling"
     },
 
     "tcpdump": {
-        "base": "Command-line packet analyzer, lightweight alternative to Wireshark",
-        "-i": "Interface to capture on (e.g., -i eth0)",
-        "-n": "Don't resolve hostnames (faster)",
-        "-v": "Verbose output",
-        "-c": "Capture count (e.g., -c 100)",
-        "-w": "Write to file (e.g., -w capture.pcap)",
-        "-r": "Read from file (e.g., -r capture.pcap)",
-        "usage": "Use for: Quick packet capture, scripting, server environments",
-        "caution": "Requires root/sudo. Use filters to avoid capturing too much data"
+        "base": "Command-line packet analyzer",
+        "-i": "Interface to capture",
+        "-w": "Write to file",
+        "-r": "Read from file",
+        "-n": "Don't resolve names",
+        "-X": "Show packet contents in hex and ASCII",
+        "usage": "Use for: Quick packet capture, network troubleshooting",
+        "caution": "Requires root/admin privileges for capture"
     },
 
     "tshark": {
-        "base": "Wireshark command-line interface, powerful CLI packet analyzer",
-        "-i": "Interface to capture on (e.g., -i eth0)",
-        "-f": "Capture filter (e.g., -f 'tcp port 80')",
-        "-Y": "Display filter (e.g., -Y 'http')",
-        "-T": "Output format (fields, json, xml, etc.)",
-        "-w": "Write to file (e.g., -w capture.pcap)",
-        "-r": "Read from file (e.g., -r capture.pcap)",
-        "usage": "Use for: Advanced packet analysis, automation, server environments",
-        "caution": "Requires root/sudo. Complex syntax but very powerful"
+        "base": "Terminal-based Wireshark",
+        "-r": "Read from capture file",
+        "-w": "Write to capture file",
+        "-Y": "Display filter",
+        "-i": "Capture interface",
+        "-T": "Output format (text, json, xml)",
+        "usage": "Use for: Automated packet analysis, scripting",
+        "caution": "Less intuitive than GUI. Learn display filter syntax"
     },
 
     "termshark": {
@@ -113,35 +107,30 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Network Utilities
     "netcat": {
-        "base": "Network utility for reading/writing data across network connections",
-        "-l": "Listen mode (server)",
-        "-p": "Port number (e.g., -p 8080)",
-        "-v": "Verbose output",
-        "-n": "Don't resolve hostnames",
-        "-e": "Execute command (e.g., -e /bin/bash)",
-        "usage": "Use for: Port scanning, banner grabbing, reverse shells, file transfer",
-        "caution": "Powerful tool. Can be used for malicious purposes. Use responsibly"
+        "base": "Network Swiss Army knife (nc)",
+        "-l": "Listen mode",
+        "-p": "Port number",
+        "-v": "Verbose",
+        "-n": "No DNS resolution",
+        "-e": "Execute command (dangerous!)",
+        "usage": "Use for: Banner grabbing, simple file transfers, backdoors",
+        "caution": "Many netcat variants exist. Check available flags"
     },
 
     "ncat": {
-        "base": "Nmap's netcat implementation with enhanced features",
-        "-l": "Listen mode (server)",
-        "-p": "Port number (e.g., -p 8080)",
-        "-v": "Verbose output",
-        "--ssl": "Use SSL/TLS encryption",
-        "-e": "Execute command (e.g., -e /bin/bash)",
-        "usage": "Use for: Secure connections, SSL tunneling, enhanced netcat features",
-        "caution": "More secure than netcat. Still powerful - use responsibly"
+        "base": "Modern netcat from nmap project",
+        "--ssl": "Use SSL",
+        "--broker": "Connection broker mode",
+        "-e": "Execute command",
+        "usage": "Use for: Improved netcat with SSL support",
+        "caution": "Different syntax than traditional nc. Check -h"
     },
 
     "socat": {
-        "base": "Multipurpose relay tool for bidirectional data transfer",
-        "TCP-LISTEN": "Listen on TCP port (e.g., TCP-LISTEN:8080)",
-        "TCP-CONNECT": "Connect to TCP host (e.g., TCP-CONNECT:target:80)",
-        "SSL-LISTEN": "Listen with SSL (e.g., SSL-LISTEN:443)",
-        "EXEC": "Execute command (e.g., EXEC:/bin/bash)",
-        "usage": "Use for: Port forwarding, SSL tunneling, protocol conversion",
-        "caution": "Very flexible tool. Complex syntax but extremely powerful"
+        "base": "Advanced netcat alternative",
+        "features": "SSL support, bidirectional transfers, port forwarding",
+        "usage": "Use for: Complex network redirections, SSL tunnels",
+        "caution": "Complex syntax. Check man page examples"
     },
 
     "proxychains": {
@@ -155,24 +144,21 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # DNS Enumeration
     "dig": {
-        "base": "DNS lookup utility for querying DNS servers",
-        "@": "DNS server to query (e.g., @8.8.8.8)",
-        "-t": "Record type (A, AAAA, MX, NS, TXT, etc.)",
-        "-x": "Reverse DNS lookup (e.g., -x 192.168.1.1)",
-        "+short": "Short output format",
-        "+trace": "Trace DNS resolution path",
-        "usage": "Use for: DNS reconnaissance, record enumeration, DNS troubleshooting",
-        "caution": "Can generate DNS queries. Use appropriate rate limiting"
+        "base": "DNS lookup utility",
+        "@": "Query specific nameserver",
+        "ANY": "Request any record type",
+        "axfr": "Zone transfer request",
+        "usage": "Use for: DNS enumeration, zone transfers, subdomain discovery",
+        "caution": "Zone transfers rarely work. Use DNSdumpster for reconnaissance"
     },
 
     "dnsenum": {
-        "base": "DNS enumeration tool for comprehensive DNS reconnaissance",
-        "-d": "Domain to enumerate (e.g., -d example.com)",
-        "-f": "Wordlist file for subdomain brute-forcing",
-        "-t": "Threads (e.g., -t 10)",
-        "-o": "Output file (e.g., -o results.txt)",
-        "usage": "Use for: Subdomain discovery, DNS zone transfers, comprehensive DNS recon",
-        "caution": "Can generate many DNS queries. Use responsibly to avoid rate limiting"
+        "base": "DNS enumeration tool",
+        "--enum": "Enumerate",
+        "-f": "File with subdomains",
+        "--threads": "Number of threads",
+        "usage": "Use for: Subdomain enumeration, zone transfer attempts",
+        "caution": "Noisy! Generates many DNS queries"
     },
 
     "fierce": {
@@ -227,15 +213,15 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Digital Forensics Tools
     "volatility": {
-        "base": "Advanced memory forensics framework for analyzing RAM dumps",
-        "-f": "Memory dump file (e.g., -f memory.dmp)",
-        "windows.pslist": "List running processes",
-        "windows.pstree": "Process tree view",
-        "windows.memmap": "Memory map for process",
-        "windows.cmdline": "Command line arguments",
-        "windows.netstat": "Network connections",
-        "usage": "Use for: Memory analysis, malware detection, incident response",
-        "caution": "Requires memory dump files. Use Volatility 3 for modern systems"
+        "base": "Memory forensics framework",
+        "-f": "Memory dump file",
+        "--profile": "OS profile (e.g., Win7SP1x64)",
+        "imageinfo": "Identify image information",
+        "pslist": "List processes",
+        "netscan": "Scan for network connections",
+        "filescan": "Scan for file objects",
+        "usage": "Use for: Memory dump analysis, malware investigation",
+        "caution": "Requires correct profile. Use imageinfo first"
     },
 
     "rekall": {
@@ -266,13 +252,12 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "sleuthkit": {
-        "base": "Command-line digital forensics toolkit (TSK)",
-        "fls": "List files and directories",
-        "ils": "List inodes",
-        "fsstat": "File system statistics",
-        "icat": "Extract file contents",
-        "usage": "Use for: Disk analysis, file recovery, timeline analysis",
-        "caution": "Command-line tool. Requires understanding of file systems"
+        "base": "The Sleuth Kit - digital forensics toolkit",
+        "fls": "List files in filesystem image",
+        "ils": "List inodes in filesystem",
+        "fsstat": "Display filesystem statistics",
+        "usage": "Use for: Digital forensics, filesystem analysis, evidence extraction",
+        "caution": "Requires filesystem images. Use with proper chain of custody"
     },
 
     "ftk": {
@@ -293,42 +278,38 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "binwalk": {
-        "base": "Firmware analysis tool for extracting embedded files and code",
-        "-e": "Extract files (e.g., -e firmware.bin)",
-        "-A": "Analyze binary for common architectures",
-        "-M": "Recursive extraction",
-        "-f": "Signature file",
-        "usage": "Use for: Firmware analysis, embedded file extraction, reverse engineering",
-        "caution": "Can extract large amounts of data. Ensure sufficient disk space"
+        "base": "Firmware analysis tool - extract and analyze embedded filesystems",
+        "-e": "Extract files from firmware images",
+        "-A": "Analyze binary files for architecture",
+        "-M": "Recursive extraction with magic number signatures",
+        "usage": "Use for: IoT firmware analysis, embedded system reconnaissance",
+        "caution": "Can extract large amounts of data. Use with disk space monitoring"
     },
 
     "exiftool": {
-        "base": "Metadata extraction and manipulation tool",
-        "-a": "Show all metadata",
-        "-g": "Group by tag",
-        "-s": "Short output",
-        "-d": "Date format",
-        "usage": "Use for: Metadata analysis, image forensics, document analysis",
-        "caution": "Can reveal sensitive information. Handle metadata carefully"
+        "base": "Read/write meta information in files",
+        "-a": "Allow duplicate tags",
+        "-G": "Print group name for each tag",
+        "usage": "Use for: Viewing/editing image metadata, finding hidden info",
+        "caution": "Can modify files. Use carefully"
     },
 
     "strings": {
-        "base": "Extract printable strings from binary files",
-        "-a": "Scan entire file",
-        "-n": "Minimum string length (e.g., -n 8)",
-        "-t": "Output format (d=decimal, o=octal, x=hex)",
-        "usage": "Use for: String extraction, malware analysis, evidence examination",
-        "caution": "Can reveal sensitive information. Use appropriate filtering"
+        "base": "Extract printable strings from files",
+        "-n": "Minimum string length (default 4)",
+        "-a": "Scan entire file (not just text sections)",
+        "-e": "Encoding (s=7-bit, S=8-bit, l=16-bit little-endian, b=16-bit big-endian)",
+        "usage": "Use for: Quick file analysis, finding hardcoded credentials, URLs",
+        "caution": "Can produce massive output on large binaries. Pipe to grep/less"
     },
 
     "foremost": {
-        "base": "File carving tool for recovering deleted files",
-        "-i": "Input file (e.g., -i disk.dd)",
-        "-o": "Output directory (e.g., -o recovered/)",
-        "-t": "File types to carve",
-        "-v": "Verbose output",
-        "usage": "Use for: File recovery, deleted file analysis, evidence extraction",
-        "caution": "Can recover sensitive deleted files. Handle recovered data appropriately"
+        "base": "File carving tool, recovers files based on headers/footers",
+        "-i": "Input file",
+        "-o": "Output directory",
+        "-t": "File types (jpg, gif, png, pdf, doc, etc.)",
+        "usage": "Use for: Recovering deleted files, extracting files from disk images",
+        "caution": "Can recover many files. Specify output directory"
     },
 
     "networkminer": {
@@ -363,12 +344,10 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Reverse Engineering Tools
     "ghidra": {
-        "base": "NSA's open-source reverse engineering framework with decompiler",
-        "gui": "Launch Ghidra GUI (ghidraRun)",
-        "headless": "Headless analysis (analyzeHeadless)",
-        "import": "Import binary (e.g., -import binary.exe)",
-        "usage": "Use for: Static binary analysis, decompiling executables, malware analysis",
-        "caution": "Resource intensive. Let auto-analysis complete before exploring"
+        "base": "NSA's software reverse engineering framework",
+        "features": "Disassembler, decompiler, debugger, scripting",
+        "usage": "Use for: Binary analysis, malware reverse engineering, vulnerability research",
+        "caution": "Steep learning curve. Start with tutorials"
     },
 
     "ida": {
@@ -381,13 +360,13 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "radare2": {
-        "base": "Open-source reverse engineering framework with command-line interface",
-        "-A": "Analyze binary (e.g., r2 -A binary)",
-        "aaa": "Auto-analyze all functions",
+        "base": "Reverse engineering framework (CLI-based)",
+        "r2": "Main binary",
+        "aaa": "Analyze all",
         "pdf": "Print disassembly of function",
-        "px": "Print hexdump",
-        "usage": "Use for: Command-line reverse engineering, scripting, automation",
-        "caution": "Steep learning curve. Command-line interface requires memorization"
+        "V": "Visual mode",
+        "usage": "Use for: Binary analysis, exploit development, debugging",
+        "caution": "Complex commands. Use r2 -h and ? for help"
     },
 
     "binaryninja": {
@@ -399,14 +378,16 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "gdb": {
-        "base": "GNU Debugger - standard debugger for Unix-like systems",
-        "-g": "Compile with debug symbols (gcc -g)",
-        "run": "Start program execution",
-        "break": "Set breakpoint (e.g., break main)",
-        "step": "Step into function calls",
-        "next": "Step over function calls",
-        "usage": "Use for: Dynamic analysis, debugging, exploit development",
-        "caution": "Requires debug symbols for meaningful analysis"
+        "base": "GNU Debugger",
+        "run": "Start program",
+        "break": "Set breakpoint",
+        "continue": "Continue execution",
+        "step": "Step one instruction",
+        "print": "Print variable/expression",
+        "x": "Examine memory",
+        "info": "Info about program state",
+        "usage": "Use for: Binary debugging, exploit development",
+        "caution": "Learn peda/gef/pwndbg plugins for better experience"
     },
 
     "pwndbg": {
@@ -492,12 +473,12 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "frida": {
-        "base": "Dynamic instrumentation toolkit for reverse engineering",
-        "-U": "Connect to USB device",
-        "-f": "Spawn application",
-        "-l": "Load JavaScript script",
-        "usage": "Use for: Dynamic instrumentation, hooking, runtime manipulation",
-        "caution": "Requires Frida server on target. Can be detected by anti-debugging"
+        "base": "Dynamic instrumentation toolkit - hook and modify mobile app behavior",
+        "spawn": "frida -U -f com.app.package -l script.js - spawn and hook app",
+        "attach": "frida -U com.app.package -l script.js - attach to running app",
+        "gadget": "FridaGadget - embed in apps for runtime analysis",
+        "usage": "Use for: Mobile app analysis, API hooking, runtime manipulation",
+        "caution": "Requires rooted Android or jailbroken iOS. May trigger anti-debugging"
     },
 
     # Attack Techniques
@@ -703,93 +684,77 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Web Enumeration
     "gobuster": {
-        "base": "Directory/file brute-forcing tool written in Go",
-        "dir": "Directory brute-forcing mode",
-        "dns": "DNS subdomain enumeration mode",
-        "vhost": "Virtual host brute-forcing mode",
+        "base": "Directory/file brute-forcing tool - web content discovery",
         "-u": "Target URL",
-        "-w": "Wordlist path (e.g., /usr/share/wordlists/dirb/common.txt)",
-        "-t": "Number of threads (default 10)",
-        "-x": "File extensions to search for (e.g., -x php,html,txt)",
-        "-k": "Skip SSL certificate verification",
-        "-b": "Blacklist response codes (e.g., -b 404)",
-        "usage": "Use for: Finding hidden endpoints, admin panels, backup files",
-        "caution": "Generates significant traffic. Use small wordlists for stealth"
+        "-w": "Wordlist file",
+        "-x": "File extensions to search for",
+        "-t": "Number of concurrent threads",
+        "usage": "Use for: Web directory enumeration, hidden file discovery",
+        "caution": "Can discover sensitive files. Use only on authorized targets"
     },
 
     "ffuf": {
-        "base": "Fast web fuzzer written in Go",
-        "-u": "Target URL with FUZZ keyword placeholder",
-        "-w": "Wordlist path",
-        "-mc": "Match HTTP response codes",
-        "-fc": "Filter HTTP response codes",
-        "-fs": "Filter response size",
-        "-t": "Number of threads",
-        "-H": "Add custom header (e.g., -H \"Cookie: session=abc\")",
-        "usage": "Use for: Directory fuzzing, parameter discovery, subdomain enumeration",
-        "caution": "Very fast. Can overwhelm servers. Start with lower thread count"
+        "base": "Fast web fuzzer - directory and parameter fuzzing",
+        "-w": "Wordlist file",
+        "-u": "Target URL with FUZZ placeholder",
+        "-H": "Custom headers",
+        "-c": "Colorize output",
+        "usage": "Use for: Web fuzzing, directory discovery, parameter fuzzing",
+        "caution": "High-speed tool. Monitor target for performance impact"
     },
 
     "nikto": {
-        "base": "Web server scanner that checks for dangerous files, outdated software, and misconfigurations",
-        "-h": "Target host/URL",
-        "-p": "Port to scan (default 80)",
-        "-ssl": "Force SSL mode",
-        "-Tuning": "Tune tests (1=interesting files, 2=misconfig, etc.)",
-        "-nossl": "Disable SSL",
-        "usage": "Use for: Quick vulnerability assessment, finding known issues",
-        "caution": "Very noisy! Generates many requests. Not stealthy at all"
+        "base": "Web server scanner - comprehensive web vulnerability scanner",
+        "-h": "Target hostname or IP",
+        "-p": "Port number",
+        "-ssl": "Use SSL/TLS",
+        "-T": "Scan tuning (0-9, higher = more tests)",
+        "usage": "Use for: Web server vulnerability assessment, security scanning",
+        "caution": "Comprehensive scans can take time. Review results carefully"
     },
 
     "dirb": {
-        "base": "Web content scanner, older but reliable",
-        "-a": "User agent string",
-        "-r": "Don't search recursively",
-        "-z": "Add millisecond delay between requests",
-        "usage": "Use for: Directory enumeration (slower than gobuster but built-in wordlists)",
-        "caution": "Slower than modern tools. Consider gobuster or ffuf for faster results"
+        "base": "Web content scanner - directory and file brute-forcing",
+        "-u": "Target URL",
+        "-w": "Custom wordlist",
+        "-S": "Silent mode (no banner)",
+        "-r": "Recursive scanning",
+        "usage": "Use for: Web directory enumeration, hidden content discovery",
+        "caution": "Older tool. Consider using gobuster or ffuf for better performance"
     },
 
     "wpscan": {
-        "base": "WordPress vulnerability scanner",
-        "--url": "Target WordPress site",
-        "--enumerate": "Enumerate (u=users, p=plugins, t=themes, vp=vulnerable plugins)",
-        "--api-token": "WPScan API token for vulnerability data",
+        "base": "WordPress vulnerability scanner that checks for vulnerable plugins, themes, and core issues",
+        "--url": "Target WordPress site URL",
+        "--enumerate": "Enumerate (u=users, p=plugins, t=themes, vp=vulnerable plugins, vt=vulnerable themes)",
+        "--api-token": "WPScan API token for vulnerability database access",
         "--force": "Force scan even if WordPress not detected",
-        "usage": "Use for: WordPress site reconnaissance, plugin/theme enumeration",
-        "caution": "Noisy scan. Can be detected by WAF/IPS"
+        "--stealthy": "Use stealth mode to avoid detection",
+        "--update": "Update vulnerability database",
+        "usage": "Use for: WordPress site reconnaissance, plugin/theme enumeration, vulnerability assessment",
+        "caution": "Noisy scan. Can be detected by WAF/IPS. Requires API token for full vulnerability data"
     },
 
     # SQL Injection
     "sqlmap": {
-        "base": "Automatic SQL injection and database takeover tool",
-        "-u": "Target URL",
-        "--data": "POST data string",
-        "--cookie": "HTTP Cookie header value",
+        "base": "SQL injection testing tool - automated SQLi detection and exploitation",
+        "-u": "Target URL for testing",
+        "--data": "POST data for testing",
         "--dbs": "Enumerate databases",
         "--tables": "Enumerate tables",
-        "--dump": "Dump table data",
-        "--risk": "Risk level (1-3, higher = more dangerous tests)",
-        "--level": "Level of tests (1-5, higher = more comprehensive)",
-        "--batch": "Non-interactive mode (accept defaults)",
-        "--technique": "SQL injection technique (B=Boolean, T=Time, E=Error, U=Union, S=Stacked)",
-        "--tamper": "Use tamper scripts to evade WAF",
-        "usage": "Use for: Automated SQLi testing and exploitation",
-        "caution": "Very aggressive! Only use on authorized targets. Can modify database"
+        "usage": "Use for: SQL injection testing, database enumeration",
+        "caution": "Use only on authorized targets. Can cause data loss"
     },
 
     # Exploitation Frameworks
     "metasploit": {
-        "base": "Comprehensive exploitation framework",
-        "msfconsole": "Main Metasploit console interface",
-        "search": "Search for exploits/modules",
-        "use": "Select a module",
-        "show options": "Display module options",
-        "set": "Set option value",
-        "exploit": "Run the exploit",
-        "sessions": "List active sessions",
-        "usage": "Use for: Exploitation, post-exploitation, payload generation",
-        "caution": "Real exploitation! Ensure authorization. Can crash services"
+        "base": "Penetration testing framework - exploit development and execution",
+        "msfconsole": "Launch Metasploit console",
+        "search": "Search for exploits and modules",
+        "use": "Select and configure exploit/module",
+        "exploit": "Execute selected exploit",
+        "usage": "Use for: Penetration testing, exploit development, post-exploitation",
+        "caution": "Powerful tool. Use only on authorized targets with proper documentation"
     },
 
     "msfconsole": {
@@ -820,42 +785,31 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
 
     # Password Cracking
     "john": {
-        "base": "John the Ripper - fast password cracker",
-        "--wordlist": "Wordlist file (e.g., rockyou.txt)",
-        "--rules": "Enable word mangling rules",
-        "--format": "Hash format (e.g., md5, sha256, bcrypt)",
-        "--show": "Show cracked passwords",
-        "--incremental": "Brute-force mode",
-        "--single": "Single crack mode (uses username variations)",
-        "usage": "Use for: Password hash cracking, testing password strength",
-        "caution": "CPU/GPU intensive. Can take hours to days"
+        "base": "John the Ripper - password cracking tool",
+        "--wordlist": "Use custom wordlist for dictionary attacks",
+        "--rules": "Apply transformation rules to wordlist",
+        "--incremental": "Brute force mode with character sets",
+        "usage": "Use for: Password cracking, hash analysis, credential recovery",
+        "caution": "Resource intensive. Use appropriate hardware for large wordlists"
     },
 
     "hashcat": {
-        "base": "Advanced password recovery tool (GPU-accelerated)",
-        "-m": "Hash type (0=MD5, 1000=NTLM, 3200=bcrypt, etc.)",
-        "-a": "Attack mode (0=straight, 1=combination, 3=brute-force, 6=hybrid)",
-        "-o": "Output file for cracked hashes",
-        "--force": "Ignore warnings",
-        "-w": "Workload profile (1=low, 2=default, 3=high, 4=nightmare)",
-        "-r": "Rules file",
-        "--show": "Show cracked passwords",
-        "usage": "Use for: Fast GPU-based password cracking",
-        "caution": "Requires GPU. Check hash mode list carefully"
+        "base": "Advanced password recovery tool - GPU-accelerated hash cracking",
+        "-m": "Hash mode (0=MD5, 100=SHA1, 1000=NTLM, etc.)",
+        "-a": "Attack mode (0=straight, 1=combinator, 3=brute-force)",
+        "--wordlist": "Dictionary attack with custom wordlist",
+        "usage": "Use for: High-performance password cracking, hash analysis",
+        "caution": "Requires powerful GPU. Monitor temperature and power consumption"
     },
 
     "hydra": {
-        "base": "Network logon cracker, supports many protocols",
-        "-l": "Single username",
+        "base": "Network login cracker - brute force login credentials",
+        "-l": "Single username for attack",
         "-L": "Username list file",
-        "-p": "Single password",
+        "-p": "Single password for attack",
         "-P": "Password list file",
-        "-t": "Number of parallel tasks",
-        "-V": "Verbose output",
-        "-f": "Exit after first valid password found",
-        "protocols": "Supports: ssh, ftp, http-post, http-get, smb, rdp, etc.",
-        "usage": "Use for: Brute-forcing login credentials",
-        "caution": "Noisy! Account lockouts are common. Use rate limiting"
+        "usage": "Use for: Brute force attacks on login services",
+        "caution": "Use only on authorized targets. Can trigger account lockouts"
     },
 
     # Wireless
@@ -886,119 +840,16 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "openssl": {
-        "base": "Cryptography toolkit and SSL/TLS library",
-        "enc": "Encryption/decryption (e.g., openssl enc -aes-256-cbc)",
-        "dgst": "Digest/hash functions",
-        "s_client": "SSL/TLS client (test connections)",
-        "x509": "X.509 certificate operations",
-        "rsa": "RSA key operations",
-        "usage": "Use for: Crypto operations, SSL testing, certificate inspection",
-        "caution": "Powerful but complex syntax. Check man pages"
+        "base": "OpenSSL toolkit - cryptographic functions and SSL/TLS testing",
+        "s_client": "Test SSL/TLS connections and certificate validation",
+        "rsa": "Generate and manipulate RSA keys",
+        "enc": "Encrypt/decrypt files with various algorithms",
+        "usage": "Use for: SSL/TLS testing, certificate analysis, cryptographic operations",
+        "caution": "Complex command syntax. Test commands in safe environment"
     },
 
     # Forensics
-    "strings": {
-        "base": "Extract printable strings from files",
-        "-n": "Minimum string length (default 4)",
-        "-a": "Scan entire file (not just text sections)",
-        "-e": "Encoding (s=7-bit, S=8-bit, l=16-bit little-endian, b=16-bit big-endian)",
-        "usage": "Use for: Quick file analysis, finding hardcoded credentials, URLs",
-        "caution": "Can produce massive output on large binaries. Pipe to grep/less"
-    },
-
-    "binwalk": {
-        "base": "Firmware analysis tool, extracts embedded files",
-        "-e": "Extract embedded files",
-        "-M": "Recursively extract",
-        "-B": "Scan for common file signatures",
-        "usage": "Use for: Firmware extraction, finding hidden files in binaries",
-        "caution": "Can create many extracted files. Review before running -M"
-    },
-
-    "foremost": {
-        "base": "File carving tool, recovers files based on headers/footers",
-        "-i": "Input file",
-        "-o": "Output directory",
-        "-t": "File types (jpg, gif, png, pdf, doc, etc.)",
-        "usage": "Use for: Recovering deleted files, extracting files from disk images",
-        "caution": "Can recover many files. Specify output directory"
-    },
-
-    "volatility": {
-        "base": "Memory forensics framework",
-        "-f": "Memory dump file",
-        "--profile": "OS profile (e.g., Win7SP1x64)",
-        "imageinfo": "Identify image information",
-        "pslist": "List processes",
-        "netscan": "Scan for network connections",
-        "filescan": "Scan for file objects",
-        "usage": "Use for: Memory dump analysis, malware investigation",
-        "caution": "Requires correct profile. Use imageinfo first"
-    },
-
-    "wireshark": {
-        "base": "Network protocol analyzer with GUI",
-        "filters": "Display filters (e.g., http, tcp.port==80, ip.addr==192.168.1.1)",
-        "tshark": "Command-line version of Wireshark",
-        "-r": "Read capture file",
-        "-w": "Write capture file",
-        "usage": "Use for: Network traffic analysis, protocol debugging",
-        "caution": "Can capture sensitive data. Handle pcaps securely"
-    },
-
-    "tshark": {
-        "base": "Terminal-based Wireshark",
-        "-r": "Read from capture file",
-        "-w": "Write to capture file",
-        "-Y": "Display filter",
-        "-i": "Capture interface",
-        "-T": "Output format (text, json, xml)",
-        "usage": "Use for: Automated packet analysis, scripting",
-        "caution": "Less intuitive than GUI. Learn display filter syntax"
-    },
-
-    "tcpdump": {
-        "base": "Command-line packet analyzer",
-        "-i": "Interface to capture",
-        "-w": "Write to file",
-        "-r": "Read from file",
-        "-n": "Don't resolve names",
-        "-X": "Show packet contents in hex and ASCII",
-        "usage": "Use for: Quick packet capture, network troubleshooting",
-        "caution": "Requires root/admin privileges for capture"
-    },
-
     # Reverse Engineering
-    "ghidra": {
-        "base": "NSA's software reverse engineering framework",
-        "features": "Disassembler, decompiler, debugger, scripting",
-        "usage": "Use for: Binary analysis, malware reverse engineering, vulnerability research",
-        "caution": "Steep learning curve. Start with tutorials"
-    },
-
-    "radare2": {
-        "base": "Reverse engineering framework (CLI-based)",
-        "r2": "Main binary",
-        "aaa": "Analyze all",
-        "pdf": "Print disassembly of function",
-        "V": "Visual mode",
-        "usage": "Use for: Binary analysis, exploit development, debugging",
-        "caution": "Complex commands. Use r2 -h and ? for help"
-    },
-
-    "gdb": {
-        "base": "GNU Debugger",
-        "run": "Start program",
-        "break": "Set breakpoint",
-        "continue": "Continue execution",
-        "step": "Step one instruction",
-        "print": "Print variable/expression",
-        "x": "Examine memory",
-        "info": "Info about program state",
-        "usage": "Use for: Binary debugging, exploit development",
-        "caution": "Learn peda/gef/pwndbg plugins for better experience"
-    },
-
     # Privilege Escalation
     "linpeas": {
         "base": "Linux Privilege Escalation Awesome Script",
@@ -1065,33 +916,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Network Analysis
-    "netcat": {
-        "base": "Network Swiss Army knife (nc)",
-        "-l": "Listen mode",
-        "-p": "Port number",
-        "-v": "Verbose",
-        "-n": "No DNS resolution",
-        "-e": "Execute command (dangerous!)",
-        "usage": "Use for: Banner grabbing, simple file transfers, backdoors",
-        "caution": "Many netcat variants exist. Check available flags"
-    },
-
-    "socat": {
-        "base": "Advanced netcat alternative",
-        "features": "SSL support, bidirectional transfers, port forwarding",
-        "usage": "Use for: Complex network redirections, SSL tunnels",
-        "caution": "Complex syntax. Check man page examples"
-    },
-
-    "ncat": {
-        "base": "Modern netcat from nmap project",
-        "--ssl": "Use SSL",
-        "--broker": "Connection broker mode",
-        "-e": "Execute command",
-        "usage": "Use for: Improved netcat with SSL support",
-        "caution": "Different syntax than traditional nc. Check -h"
-    },
-
     # Enumeration
     "enum4linux": {
         "base": "Linux/Samba enumeration tool",
@@ -1155,12 +979,13 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     "gcloud": {
-        "base": "Google Cloud CLI",
-        "compute": "Compute Engine operations",
-        "storage": "Cloud Storage operations",
-        "projects": "Project management",
-        "usage": "Use for: GCP resource management",
-        "caution": "Requires authentication. Use gcloud auth login"
+        "base": "Google Cloud CLI - manage GCP services from terminal",
+        "auth": "gcloud auth login - authenticate with Google Cloud",
+        "compute": "gcloud compute instances list - list compute instances",
+        "storage": "gcloud storage ls - list Cloud Storage buckets",
+        "iam": "gcloud iam service-accounts list - enumerate service accounts",
+        "usage": "Use for: GCP reconnaissance, service enumeration, credential discovery",
+        "caution": "Requires valid GCP credentials. Check for service account permissions"
     },
 
     # Steganography
@@ -1183,14 +1008,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Java required. GUI-based tool"
     },
 
-    "exiftool": {
-        "base": "Read/write meta information in files",
-        "-a": "Allow duplicate tags",
-        "-G": "Print group name for each tag",
-        "usage": "Use for: Viewing/editing image metadata, finding hidden info",
-        "caution": "Can modify files. Use carefully"
-    },
-
     # Git
     "git": {
         "base": "Distributed version control system",
@@ -1209,15 +1026,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # DNS
-    "dig": {
-        "base": "DNS lookup utility",
-        "@": "Query specific nameserver",
-        "ANY": "Request any record type",
-        "axfr": "Zone transfer request",
-        "usage": "Use for: DNS enumeration, zone transfers, subdomain discovery",
-        "caution": "Zone transfers rarely work. Use DNSdumpster for reconnaissance"
-    },
-
     "nslookup": {
         "base": "Query DNS nameservers",
         "usage": "Use for: Simple DNS queries",
@@ -1231,15 +1039,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Limited compared to dig"
     },
 
-    "dnsenum": {
-        "base": "DNS enumeration tool",
-        "--enum": "Enumerate",
-        "-f": "File with subdomains",
-        "--threads": "Number of threads",
-        "usage": "Use for: Subdomain enumeration, zone transfer attempts",
-        "caution": "Noisy! Generates many DNS queries"
-    },
-
     # Web Security Tools - Proxies
     "burp suite": {
         "base": "Industry-standard web application security testing platform with comprehensive proxy, scanner, and manual testing tools",
@@ -1287,43 +1086,18 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "usage": "Use for: Modern web security testing, team collaboration, API security testing",
         "caution": "Commercial tool with subscription model. Ensure proper licensing for your use case"
     },
-
-    "http toolkit": {
-        "base": "Beautiful and open-source HTTP(S) debugging proxy, inspector, and repeater",
-        "proxy": "Intercept and modify HTTP/S traffic with modern interface",
-        "repeater": "Manually test and modify requests",
-        "inspector": "Detailed analysis of HTTP headers, cookies, and responses",
-        "mock": "Create mock responses for API testing",
-        "usage": "Use for: API development, web debugging, security testing, learning HTTP",
-        "caution": "Primarily designed for development. Use additional security tools for comprehensive testing"
-    },
-
-    # Web Security Tools - Scanners
-    "nikto": {
-        "base": "Web server scanner that checks for dangerous files, outdated software, and misconfigurations",
-        "-h": "Target host/URL to scan",
-        "-p": "Port to scan (default 80)",
-        "-ssl": "Force SSL mode for HTTPS scanning",
-        "-Tuning": "Tune tests (1=interesting files, 2=misconfig, 3=information disclosure, etc.)",
-        "-nossl": "Disable SSL",
-        "-C": "Include cookies in requests",
-        "-useragent": "Custom user agent string",
-        "usage": "Use for: Quick vulnerability assessment, finding known issues, initial reconnaissance",
-        "caution": "Very noisy! Generates many requests. Not stealthy at all. Use on authorized targets only"
-    },
-
-    "wpscan": {
-        "base": "WordPress vulnerability scanner that checks for vulnerable plugins, themes, and core issues",
-        "--url": "Target WordPress site URL",
-        "--enumerate": "Enumerate (u=users, p=plugins, t=themes, vp=vulnerable plugins, vt=vulnerable themes)",
-        "--api-token": "WPScan API token for vulnerability database access",
-        "--force": "Force scan even if WordPress not detected",
-        "--stealthy": "Use stealth mode to avoid detection",
-        "--update": "Update vulnerability database",
-        "usage": "Use for: WordPress site reconnaissance, plugin/theme enumeration, vulnerability assessment",
-        "caution": "Noisy scan. Can be detected by WAF/IPS. Requires API token for full vulnerability data"
+
+    "http toolkit": {
+        "base": "Beautiful and open-source HTTP(S) debugging proxy, inspector, and repeater",
+        "proxy": "Intercept and modify HTTP/S traffic with modern interface",
+        "repeater": "Manually test and modify requests",
+        "inspector": "Detailed analysis of HTTP headers, cookies, and responses",
+        "mock": "Create mock responses for API testing",
+        "usage": "Use for: API development, web debugging, security testing, learning HTTP",
+        "caution": "Primarily designed for development. Use additional security tools for comprehensive testing"
     },
 
+    # Web Security Tools - Scanners
     "wapiti": {
         "base": "Web application vulnerability scanner that performs black-box testing",
         "-u": "Target URL to scan",
@@ -1388,19 +1162,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Web Security Tools - Directory/File Fuzzers
-    "ffuf": {
-        "base": "Fast web fuzzer written in Go with excellent performance and flexibility",
-        "-u": "Target URL with FUZZ keyword placeholder",
-        "-w": "Wordlist file path",
-        "-mc": "Match HTTP response codes (e.g., -mc 200,204,301,302)",
-        "-fc": "Filter HTTP response codes (e.g., -fc 404,403)",
-        "-fs": "Filter response size (e.g., -fs 1234)",
-        "-t": "Number of threads (default 40)",
-        "-H": "Add custom header (e.g., -H \"Cookie: session=abc\")",
-        "usage": "Use for: Directory fuzzing, parameter discovery, subdomain enumeration, content discovery",
-        "caution": "Very fast. Can overwhelm servers. Start with lower thread count. Use rate limiting"
-    },
-
     "wfuzz": {
         "base": "Web application fuzzer that can be used for finding resources not linked, bruteforcing GET and POST parameters, and more",
         "-w": "Wordlist file",
@@ -1422,19 +1183,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Older tool, slower than modern alternatives. Consider gobuster or ffuf for better performance"
     },
 
-    "gobuster": {
-        "base": "Directory/file brute-forcing tool written in Go with excellent performance",
-        "dir": "Directory brute-forcing mode",
-        "dns": "DNS subdomain enumeration mode",
-        "vhost": "Virtual host brute-forcing mode",
-        "-u": "Target URL",
-        "-w": "Wordlist path (e.g., /usr/share/wordlists/dirb/common.txt)",
-        "-t": "Number of threads (default 10)",
-        "-x": "File extensions to search for (e.g., -x php,html,txt)",
-        "usage": "Use for: Finding hidden endpoints, admin panels, backup files, subdomain enumeration",
-        "caution": "Generates significant traffic. Use small wordlists for stealth. Consider rate limiting"
-    },
-
     "feroxbuster": {
         "base": "Fast, simple, recursive content discovery tool written in Rust",
         "-u": "Target URL",
@@ -1487,21 +1235,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Web Security Tools - Specialized
-    "sqlmap": {
-        "base": "Automatic SQL injection and database takeover tool with comprehensive testing capabilities",
-        "-u": "Target URL",
-        "--data": "POST data string",
-        "--cookie": "HTTP Cookie header value",
-        "--dbs": "Enumerate databases",
-        "--tables": "Enumerate tables",
-        "--dump": "Dump table data",
-        "--risk": "Risk level (1-3, higher = more dangerous tests)",
-        "--level": "Level of tests (1-5, higher = more comprehensive)",
-        "--batch": "Non-interactive mode (accept defaults)",
-        "usage": "Use for: Automated SQLi testing and exploitation, database enumeration",
-        "caution": "Very aggressive! Only use on authorized targets. Can modify database. Use --batch for automation"
-    },
-
     "xsstrike": {
         "base": "Advanced XSS detection and exploitation tool with intelligent payload generation",
         "-u": "Target URL",
@@ -1586,16 +1319,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Requires valid AWS credentials. Monitor for API rate limits"
     },
 
-    "gcloud": {
-        "base": "Google Cloud CLI - manage GCP services from terminal",
-        "auth": "gcloud auth login - authenticate with Google Cloud",
-        "compute": "gcloud compute instances list - list compute instances",
-        "storage": "gcloud storage ls - list Cloud Storage buckets",
-        "iam": "gcloud iam service-accounts list - enumerate service accounts",
-        "usage": "Use for: GCP reconnaissance, service enumeration, credential discovery",
-        "caution": "Requires valid GCP credentials. Check for service account permissions"
-    },
-
     "azure-cli": {
         "base": "Azure CLI - manage Microsoft Azure services from terminal",
         "login": "az login - authenticate with Azure",
@@ -1607,15 +1330,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Mobile Security Tools
-    "frida": {
-        "base": "Dynamic instrumentation toolkit - hook and modify mobile app behavior",
-        "spawn": "frida -U -f com.app.package -l script.js - spawn and hook app",
-        "attach": "frida -U com.app.package -l script.js - attach to running app",
-        "gadget": "FridaGadget - embed in apps for runtime analysis",
-        "usage": "Use for: Mobile app analysis, API hooking, runtime manipulation",
-        "caution": "Requires rooted Android or jailbroken iOS. May trigger anti-debugging"
-    },
-
     "mobsf": {
         "base": "Mobile Security Framework - automated mobile app security testing",
         "static": "Static analysis of Android APK and iOS IPA files",
@@ -1634,15 +1348,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Requires significant resources. Some firmware may not emulate properly"
     },
 
-    "binwalk": {
-        "base": "Firmware analysis tool - extract and analyze embedded filesystems",
-        "-e": "Extract files from firmware images",
-        "-A": "Analyze binary files for architecture",
-        "-M": "Recursive extraction with magic number signatures",
-        "usage": "Use for: IoT firmware analysis, embedded system reconnaissance",
-        "caution": "Can extract large amounts of data. Use with disk space monitoring"
-    },
-
     # OSINT Tools
     "theharvester": {
         "base": "OSINT tool for gathering email addresses, subdomains, and IPs",
@@ -1671,34 +1376,7 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Cryptography Tools
-    "openssl": {
-        "base": "OpenSSL toolkit - cryptographic functions and SSL/TLS testing",
-        "s_client": "Test SSL/TLS connections and certificate validation",
-        "rsa": "Generate and manipulate RSA keys",
-        "enc": "Encrypt/decrypt files with various algorithms",
-        "usage": "Use for: SSL/TLS testing, certificate analysis, cryptographic operations",
-        "caution": "Complex command syntax. Test commands in safe environment"
-    },
-
-    "john": {
-        "base": "John the Ripper - password cracking tool",
-        "--wordlist": "Use custom wordlist for dictionary attacks",
-        "--rules": "Apply transformation rules to wordlist",
-        "--incremental": "Brute force mode with character sets",
-        "usage": "Use for: Password cracking, hash analysis, credential recovery",
-        "caution": "Resource intensive. Use appropriate hardware for large wordlists"
-    },
-
     # Forensics Tools
-    "sleuthkit": {
-        "base": "The Sleuth Kit - digital forensics toolkit",
-        "fls": "List files in filesystem image",
-        "ils": "List inodes in filesystem",
-        "fsstat": "Display filesystem statistics",
-        "usage": "Use for: Digital forensics, filesystem analysis, evidence extraction",
-        "caution": "Requires filesystem images. Use with proper chain of custody"
-    },
-
     "bulk-extractor": {
         "base": "Digital forensics tool - extract information from disk images",
         "-o": "Output directory for extracted data",
@@ -1726,45 +1404,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     },
 
     # Additional Security Tools
-    "hashcat": {
-        "base": "Advanced password recovery tool - GPU-accelerated hash cracking",
-        "-m": "Hash mode (0=MD5, 100=SHA1, 1000=NTLM, etc.)",
-        "-a": "Attack mode (0=straight, 1=combinator, 3=brute-force)",
-        "--wordlist": "Dictionary attack with custom wordlist",
-        "usage": "Use for: High-performance password cracking, hash analysis",
-        "caution": "Requires powerful GPU. Monitor temperature and power consumption"
-    },
-
-    "hydra": {
-        "base": "Network login cracker - brute force login credentials",
-        "-l": "Single username for attack",
-        "-L": "Username list file",
-        "-p": "Single password for attack",
-        "-P": "Password list file",
-        "usage": "Use for: Brute force attacks on login services",
-        "caution": "Use only on authorized targets. Can trigger account lockouts"
-    },
-
-    "sqlmap": {
-        "base": "SQL injection testing tool - automated SQLi detection and exploitation",
-        "-u": "Target URL for testing",
-        "--data": "POST data for testing",
-        "--dbs": "Enumerate databases",
-        "--tables": "Enumerate tables",
-        "usage": "Use for: SQL injection testing, database enumeration",
-        "caution": "Use only on authorized targets. Can cause data loss"
-    },
-
-    "metasploit": {
-        "base": "Penetration testing framework - exploit development and execution",
-        "msfconsole": "Launch Metasploit console",
-        "search": "Search for exploits and modules",
-        "use": "Select and configure exploit/module",
-        "exploit": "Execute selected exploit",
-        "usage": "Use for: Penetration testing, exploit development, post-exploitation",
-        "caution": "Powerful tool. Use only on authorized targets with proper documentation"
-    },
-
     "burp-suite": {
         "base": "Web application security testing platform - proxy and scanner",
         "proxy": "Intercept and modify HTTP/HTTPS traffic",
@@ -1775,65 +1414,6 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
         "caution": "Requires proper configuration. May generate false positives"
     },
 
-    "wireshark": {
-        "base": "Network protocol analyzer - capture and analyze network traffic",
-        "capture": "Live packet capture from network interfaces",
-        "filters": "Display filters to focus on specific traffic",
-        "analysis": "Deep packet inspection and protocol analysis",
-        "usage": "Use for: Network troubleshooting, security analysis, protocol study",
-        "caution": "Can capture sensitive data. Ensure proper authorization and handling"
-    },
-
-    "nmap": {
-        "base": "Network mapper - port scanning and service detection",
-        "-sS": "TCP SYN scan (stealth scan)",
-        "-sV": "Service version detection",
-        "-O": "Operating system detection",
-        "-A": "Aggressive scan with OS detection, version detection, script scanning",
-        "usage": "Use for: Network reconnaissance, port scanning, service enumeration",
-        "caution": "Use responsibly. Some scans may be detected by IDS/IPS"
-    },
-
-    "gobuster": {
-        "base": "Directory/file brute-forcing tool - web content discovery",
-        "-u": "Target URL",
-        "-w": "Wordlist file",
-        "-x": "File extensions to search for",
-        "-t": "Number of concurrent threads",
-        "usage": "Use for: Web directory enumeration, hidden file discovery",
-        "caution": "Can discover sensitive files. Use only on authorized targets"
-    },
-
-    "ffuf": {
-        "base": "Fast web fuzzer - directory and parameter fuzzing",
-        "-w": "Wordlist file",
-        "-u": "Target URL with FUZZ placeholder",
-        "-H": "Custom headers",
-        "-c": "Colorize output",
-        "usage": "Use for: Web fuzzing, directory discovery, parameter fuzzing",
-        "caution": "High-speed tool. Monitor target for performance impact"
-    },
-
-    "dirb": {
-        "base": "Web content scanner - directory and file brute-forcing",
-        "-u": "Target URL",
-        "-w": "Custom wordlist",
-        "-S": "Silent mode (no banner)",
-        "-r": "Recursive scanning",
-        "usage": "Use for: Web directory enumeration, hidden content discovery",
-        "caution": "Older tool. Consider using gobuster or ffuf for better performance"
-    },
-
-    "nikto": {
-        "base": "Web server scanner - comprehensive web vulnerability scanner",
-        "-h": "Target hostname or IP",
-        "-p": "Port number",
-        "-ssl": "Use SSL/TLS",
-        "-T": "Scan tuning (0-9, higher = more tests)",
-        "usage": "Use for: Web server vulnerability assessment, security scanning",
-        "caution": "Comprehensive scans can take time. Review results carefully"
-    },
-
     # Additional Security Concepts
     "zero-day": {
         "base": "Zero-day vulnerability - unknown security flaw with no patch available",
@@ -1938,12 +1518,48 @@ EXPLAIN_DB: dict[str, dict[str, str]] = {
     }
 }
 
+# Frozen so the derived tables below can never go stale
+EXPLAIN_DB: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    tool: MappingProxyType(entry) for tool, entry in _EXPLAIN_DB_RAW.items()
+})
+
+_EXPLAIN_META = frozenset(("base", "usage", "caution"))
+
+
+def _explain_flags(entry: Mapping[str, str]) -> tuple[tuple[str, str], ...]:
+    """Return (flag, rendered line) pairs for the flag keys of an entry."""
+    return tuple(
+        (flag, f"{flag}: {desc}")
+        for flag, desc in entry.items()
+        if flag not in _EXPLAIN_META
+    )
+
+
+def _explain_tail(entry: Mapping[str, str]) -> tuple[str, ...]:
+    """Return the rendered usage/caution lines of an entry."""
+    tail = []
+    if "usage" in entry:
+        tail.append(f"Use when: {entry['usage']}")
+    if "caution" in entry:
+        tail.append(f"⚠ {entry['caution']}")
+    return tuple(tail)
+
+
+# Flag and trailing lines split out of each tool entry once, so smart_explain
+# only scans real flags and never re-formats the same lines
+_EXPLAIN_FLAGS: dict[str, tuple[tuple[str, str], ...]] = {
+    tool: _explain_flags(entry) for tool, entry in EXPLAIN_DB.items()
+}
+_EXPLAIN_TAIL: dict[str, tuple[str, ...]] = {
+    tool: _explain_tail(entry) for tool, entry in EXPLAIN_DB.items()
+}
+
 
 # ============================================================================
 # TIP DATABASE - 35+ security topics
 # ============================================================================
 
-TIP_DB: dict[str, str] = {
+_TIP_DB_RAW: dict[str, str] = {
     "sql injection": """• Look for ' or " in inputs to trigger SQL errors
 • Test with: ' OR '1'='1 -- (boolean bypass)
 • Use UNION SELECT to extract data: ' UNION SELECT null,username,password FROM users--
@@ -2212,12 +1828,14 @@ TIP_DB: dict[str, str] = {
 • Framework: OWASP Amass, theHarvester, Recon-ng"""
 }
 
+TIP_DB: Mapping[str, str] = MappingProxyType(_TIP_DB_RAW)
+
 
 # ============================================================================
 # ASSIST/HELP DATABASE - 25+ common errors
 # ============================================================================
 
-ASSIST_DB: dict[str, str] = {
+_ASSIST_DB_RAW: dict[str, str] = {
     "connection refused": """• Target host/service may be down
 • Check IP address and port number (typos?)
 • Ensure you're on the correct network/VPN
@@ -2400,12 +2018,14 @@ ASSIST_DB: dict[str, str] = {
 • Enumerate: wpscan --url target.com --enumerate u,vp,vt"""
 }
 
+ASSIST_DB: Mapping[str, str] = MappingProxyType(_ASSIST_DB_RAW)
+
 
 # ============================================================================
 # REPORT DATABASE - 18+ vulnerability types
 # ============================================================================
 
-REPORT_DB: dict[str, str] = {
+_REPORT_DB_RAW: dict[str, str] = {
     "sql injection": """Vulnerability: SQL Injection in login form (username parameter)
 Impact: Attacker can bypass authentication, extract sensitive database contents including user credentials, modify/delete data, and potentially execute system commands
 Mitigation: Use prepared statements with parameterized queries, implement input validation, apply principle of least privilege to database accounts, use WAF as defense-in-depth""",
@@ -2495,12 +2115,14 @@ Impact: Attacker gains intelligence about system architecture, software versions
 Mitigation: Implement generic error messages for users, log detailed errors server-side only, disable debug mode in production, remove version headers, implement custom error pages"""
 }
 
+REPORT_DB: Mapping[str, str] = MappingProxyType(_REPORT_DB_RAW)
+
 
 # ============================================================================
 # QUIZ DATABASE - 25+ security topics
 # ============================================================================
 
-QUIZ_DB: dict[str, str] = {
+_QUIZ_DB_RAW: dict[str, str] = {
     "sql injection": """Q: What does the SQL payload ' OR '1'='1'-- do?
 A: Bypasses authentication by making WHERE clause always true, comments out rest of query
 
@@ -2528,11 +2150,11 @@ A: ASLR (Address Space Layout Randomization) and DEP/NX (Data Execution Preventi
 Q: What C function is notoriously vulnerable to buffer overflows?
 A: strcpy() - copies without bounds checking (use strncpy instead)""",
 
-    "cryptography": """Q: What's the difference between encoding and encryption?
-A: Encoding transforms data format (reversible without key); encryption requires secret key
+    "cryptography": """Q: What's the difference between symmetric and asymmetric encryption?
+A: Symmetric uses same key for encrypt/decrypt; asymmetric uses public/private key pairs
 
-Q: Why is ECB mode considered weak?
-A: Identical plaintext blocks produce identical ciphertext blocks, revealing patterns
+Q: Why is ECB mode considered insecure?
+A: Identical plaintext blocks produce identical ciphertext, revealing patterns
 
 Q: What's a rainbow table attack?
 A: Precomputed hash lookup table to reverse hashes without brute-forcing (defeated by salts)""",
@@ -2663,14 +2285,14 @@ A: Authorization (e.g., Bearer token) or custom headers like X-API-Key
 Q: What's the principle of least privilege in API design?
 A: Grant minimum permissions needed; revoke access when no longer required""",
 
-    "forensics": """Q: What are magic bytes?
-A: File signature at beginning (e.g., FF D8 FF for JPEG)
+    "forensics": """Q: What's the difference between live and dead forensics?
+A: Live forensics analyzes running systems; dead forensics analyzes offline storage
 
-Q: What's the difference between file carving and file recovery?
-A: Carving extracts based on signatures/structure; recovery uses filesystem metadata
+Q: What's the purpose of write blockers in forensics?
+A: Prevent modification of evidence during acquisition to maintain chain of custody
 
-Q: What does strings command do?
-A: Extracts printable character sequences from binary files""",
+Q: What's timeline analysis in digital forensics?
+A: Correlating timestamps across multiple sources to reconstruct events chronologically""",
 
     "steganography": """Q: What does LSB steganography mean?
 A: Least Significant Bit - hiding data in lowest bits of pixel values
@@ -2681,14 +2303,14 @@ A: EXIF data (camera, GPS, timestamps, software used)
 Q: Name a tool for analyzing audio spectrograms
 A: Audacity (View → Spectrogram)""",
 
-    "cloud security": """Q: What's an AWS S3 bucket ACL misconfiguration?
-A: Public read/write access allowing anyone to list/download/upload files
+    "cloud security": """Q: What's the AWS metadata service endpoint?
+A: 169.254.169.254 - can reveal instance metadata, IAM roles, and credentials
 
-Q: What service provides temporary AWS credentials?
-A: STS (Security Token Service) via IAM roles
+Q: What's a common S3 bucket misconfiguration?
+A: Public read access (s3:GetObject) on buckets containing sensitive data
 
-Q: What's the shared responsibility model?
-A: Cloud provider secures infrastructure; customer secures data and applications""",
+Q: What's the difference between IAM users and roles?
+A: Users have permanent credentials; roles are assumed temporarily with STS tokens""",
 
     "active directory": """Q: What's Kerberoasting?
 A: Requesting TGS tickets for accounts with SPNs, cracking tickets offline
@@ -2708,14 +2330,14 @@ A: Gives container all capabilities, access to devices, disables security featur
 Q: How to check if you're in a container?
 A: Check /.dockerenv, examine /proc/1/cgroup, or look for Docker-related processes""",
 
-    "reverse engineering": """Q: What's the difference between disassembly and decompilation?
-A: Disassembly converts to assembly; decompilation attempts to recreate source code
+    "reverse engineering": """Q: What's the difference between static and dynamic analysis?
+A: Static analyzes code without execution; dynamic observes behavior during runtime
 
-Q: What packer/protector obfuscates malware?
-A: UPX, Themida, VMProtect (compress and encrypt executables)
+Q: What's a common obfuscation technique in malware?
+A: Packing/compression to hide code structure and make analysis harder
 
-Q: What does 'strings' command help with in RE?
-A: Quickly finds hardcoded strings (URLs, IPs, function names, error messages)""",
+Q: What's the purpose of a debugger in reverse engineering?
+A: Step through code execution, examine memory, and understand program flow""",
 
     "threat modeling": """Q: What does STRIDE stand for?
 A: Spoofing, Tampering, Repudiation, Information disclosure, Denial of service, Elevation of privilege
@@ -2726,15 +2348,6 @@ A: Vulnerability unknown to vendor/public, no patch available
 Q: What's defense in depth?
 A: Multiple layers of security controls (if one fails, others still protect)""",
 
-    "cloud security": """Q: What's the AWS metadata service endpoint?
-A: 169.254.169.254 - can reveal instance metadata, IAM roles, and credentials
-
-Q: What's a common S3 bucket misconfiguration?
-A: Public read access (s3:GetObject) on buckets containing sensitive data
-
-Q: What's the difference between IAM users and roles?
-A: Users have permanent credentials; roles are assumed temporarily with STS tokens""",
-
     "mobile security": """Q: What's the main difference between iOS and Android security models?
 A: iOS uses app sandboxing and code signing; Android uses permission-based access control
 
@@ -2753,33 +2366,6 @@ A: Data interception and device impersonation in local networks
 Q: What's firmware analysis in IoT security?
 A: Reverse engineering device firmware to find vulnerabilities and backdoors""",
 
-    "cryptography": """Q: What's the difference between symmetric and asymmetric encryption?
-A: Symmetric uses same key for encrypt/decrypt; asymmetric uses public/private key pairs
-
-Q: Why is ECB mode considered insecure?
-A: Identical plaintext blocks produce identical ciphertext, revealing patterns
-
-Q: What's a rainbow table attack?
-A: Precomputed hash lookup table to reverse hashes without brute-forcing (defeated by salts)""",
-
-    "forensics": """Q: What's the difference between live and dead forensics?
-A: Live forensics analyzes running systems; dead forensics analyzes offline storage
-
-Q: What's the purpose of write blockers in forensics?
-A: Prevent modification of evidence during acquisition to maintain chain of custody
-
-Q: What's timeline analysis in digital forensics?
-A: Correlating timestamps across multiple sources to reconstruct events chronologically""",
-
-    "reverse engineering": """Q: What's the difference between static and dynamic analysis?
-A: Static analyzes code without execution; dynamic observes behavior during runtime
-
-Q: What's a common obfuscation technique in malware?
-A: Packing/compression to hide code structure and make analysis harder
-
-Q: What's the purpose of a debugger in reverse engineering?
-A: Step through code execution, examine memory, and understand program flow""",
-
     "osint": """Q: What's the purpose of OSINT in cybersecurity?
 A: Gathering publicly available information about targets for reconnaissance
 
@@ -2799,12 +2385,14 @@ Q: What's the principle of least privilege in social engineering defense?
 A: Limiting user access to only what's necessary for their job function"""
 }
 
+QUIZ_DB: Mapping[str, str] = MappingProxyType(_QUIZ_DB_RAW)
+
 
 # ============================================================================
 # PLAN DATABASE - 35+ contextual scenarios
 # ============================================================================
 
-PLAN_DB: dict[str, str] = {
+_PLAN_DB_RAW: dict[str, str] = {
     "found port 80 open": """1. Enumerate web service with nikto -h http://target or whatweb http://target
 2. Check robots.txt, sitemap.xml, and common endpoints (/admin, /api, /.git)
 3. Run directory brute-force with gobuster or ffuf using medium wordlist""",
@@ -2946,12 +2534,34 @@ PLAN_DB: dict[str, str] = {
 3. Proxy traffic through Burp (install Burp CA cert on device)"""
 }
 
+PLAN_DB: Mapping[str, str] = MappingProxyType(_PLAN_DB_RAW)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def find_best_match(query: str, database: dict[str, any]) -> tuple[str, float]:
+# (key, lowercased key) pairs per table, keyed by table identity, so matching
+# never re-lowercases the whole table for each query
+_LOWERED_KEYS: dict[
+    int, tuple[Mapping[str, object], tuple[tuple[str, str], ...]]
+] = {
+    id(db): (db, tuple((key, key.lower()) for key in db))
+    for db in (EXPLAIN_DB, TIP_DB, ASSIST_DB, REPORT_DB, QUIZ_DB, PLAN_DB)
+}
+
+
+def _lowered_keys(database: Mapping[str, object]) -> tuple[tuple[str, str], ...]:
+    """Return (key, lowercased key) pairs, precomputed for the module tables."""
+    cached = _LOWERED_KEYS.get(id(database))
+    if cached is not None and cached[0] is database:
+        return cached[1]
+    return tuple((key, key.lower()) for key in database)
+
+
+def find_best_match(
+    query: str, database: Mapping[str, object]
+) -> tuple[str | None, float]:
     """
     Find best matching entry in database based on keyword overlap.
     Returns (key, score) where score is percentage of query words found.
@@ -2962,14 +2572,14 @@ def find_best_match(query: str, database: dict[str, any]) -> tuple[str, float]:
     best_key = None
     best_score = 0.0
 
-    for key in database:
-        key_words = set(key.lower().split())
-        # Check how many query words appear in the key
-        matches = sum(1 for word in query_words if any(word in key_word for key_word in key_words))
+    for key, key_lower in _lowered_keys(database):
+        # Check how many query words appear in the key; a query word holds no
+        # whitespace, so it is inside some key word iff it is inside the key
+        matches = sum(1 for word in query_words if word in key_lower)
         score = matches / len(query_words) if query_words else 0
 
         # Also check if full key appears in query
-        if key.lower() in query_lower:
+        if key_lower in query_lower:
             score += 0.5
 
         if score > best_score:
@@ -2987,35 +2597,23 @@ def smart_explain(command: str) -> str:
     base_cmd = cmd.split()[0].lower() if cmd else ""
 
     # Check for exact matches first
-    if base_cmd in EXPLAIN_DB:
-        entry = EXPLAIN_DB[base_cmd]
+    entry = EXPLAIN_DB.get(base_cmd)
+    if entry is not None:
         parts = [entry["base"]]
 
-        # Add flag-specific explanations
-        for flag, desc in entry.items():
-            if flag in ["base", "usage", "caution"]:
-                continue
-            # Check for flag in original command (case-sensitive)
-            if flag in cmd:
-                parts.append(f"{flag}: {desc}")
+        # Add flag-specific explanations; check for flag in original
+        # command (case-sensitive)
+        parts.extend(line for flag, line in _EXPLAIN_FLAGS[base_cmd] if flag in cmd)
 
         # Add usage and caution
-        if "usage" in entry:
-            parts.append(f"Use when: {entry['usage']}")
-        if "caution" in entry:
-            parts.append(f"⚠ {entry['caution']}")
+        parts.extend(_EXPLAIN_TAIL[base_cmd])
 
         return "\n".join(parts)
 
     # Try partial matches
     for tool, entry in EXPLAIN_DB.items():
         if tool in cmd:
-            parts = [entry["base"]]
-            if "usage" in entry:
-                parts.append(f"Use when: {entry['usage']}")
-            if "caution" in entry:
-                parts.append(f"⚠ {entry['caution']}")
-            return "\n".join(parts)
+            return "\n".join((entry["base"], *_EXPLAIN_TAIL[tool]))
 
     return "Command not in knowledge base. Try a simpler example or check man page."
 
@@ -13,6 +13,9 @@ from rich.console import Console
 
 console = Console()
 
+# Commands offered as "did you mean" candidates for unknown input
+VALID_COMMANDS = ["explain", "tip", "plan", "assist", "report", "quiz", "help"]
+
 
 class SmartError:
     """Smart error class with actionable feedback."""
@@ -104,11 +107,7 @@ def handle_unknown_command(command: str) -> SmartError:
     """
     from .suggestions import get_command_suggestions
 
-    valid_commands = [
-        "explain", "tip", "plan", "assist", "report", "quiz", "help"
-    ]
-
-    suggestions = get_command_suggestions(command, valid_commands)
+    suggestions = get_command_suggestions(command, VALID_COMMANDS)
 
     return SmartError(
         message=f'Unknown command: "{command}"',
@@ -1,9 +1,24 @@
 """Syntax highlighting and formatting utilities for Cybuddy output."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 from rich.console import Console
 from rich.syntax import Syntax
 
+# Leading words of security tool commands, highlighted as bash
+_SECURITY_TOOLS = frozenset({
+    'nmap', 'sqlmap', 'gobuster', 'ffuf', 'nikto', 'hydra',
+    'john', 'hashcat', 'metasploit', 'msfconsole', 'msfvenom',
+    'burpsuite', 'zaproxy', 'wireshark', 'tcpdump', 'netcat',
+    'nc', 'ssh', 'telnet', 'ftp', 'curl', 'wget', 'dig',
+    'nslookup', 'whois', 'ping', 'traceroute', 'netstat',
+    'iptables', 'aircrack', 'airmon', 'reaver', 'wifite',
+    'enum4linux', 'smbclient', 'crackmapexec', 'bloodhound',
+    'mimikatz', 'responder', 'impacket', 'searchsploit',
+    'exploit', 'payload', 'auxiliary', 'post'
+})
+
 
 def detect_language(text: str) -> str:
     """
@@ -25,19 +40,7 @@ def detect_language(text: str) -> str:
 
     # Common security tools are typically bash commands
     first_token = text.strip().split()[0] if text.strip() else ''
-    common_tools = {
-        'nmap', 'sqlmap', 'gobuster', 'ffuf', 'nikto', 'hydra',
-        'john', 'hashcat', 'metasploit', 'msfconsole', 'msfvenom',
-        'burpsuite', 'zaproxy', 'wireshark', 'tcpdump', 'netcat',
-        'nc', 'ssh', 'telnet', 'ftp', 'curl', 'wget', 'dig',
-        'nslookup', 'whois', 'ping', 'traceroute', 'netstat',
-        'iptables', 'aircrack', 'airmon', 'reaver', 'wifite',
-        'enum4linux', 'smbclient', 'crackmapexec', 'bloodhound',
-        'mimikatz', 'responder', 'impacket', 'searchsploit',
-        'exploit', 'payload', 'auxiliary', 'post'
-    }
-
-    if first_token.lower() in common_tools:
+    if first_token.lower() in _SECURITY_TOOLS:
         return 'bash'
 
     # Check for Python indicators
@@ -122,10 +125,31 @@ def highlight_code_block(
     console.print(syntax)
 
 
+# Substrings and leading words that mark a line as code/command
+_CODE_INDICATORS = (
+    '#!',  # Shebang
+    'import ', 'from ',  # Python
+    'def ', 'class ',  # Python
+    'function ', 'const ', 'let ', 'var ',  # JavaScript
+    'nmap ', 'sqlmap ', 'curl ',  # Common tools
+    '#!/',  # Script
+    '-', '--',  # Command flags (multiple)
+)
+_COMMON_COMMANDS = frozenset({
+    'ls', 'cd', 'pwd', 'cat', 'grep', 'find', 'chmod',
+    'chown', 'ps', 'kill', 'top', 'df', 'du', 'mount',
+    'sudo', 'su', 'apt', 'yum', 'dnf', 'pacman',
+    'git', 'docker', 'kubectl', 'npm', 'pip', 'python'
+})
+
+
+@lru_cache(maxsize=1024)
 def is_likely_code(text: str) -> bool:
     """
     Determine if text is likely code/command that should be highlighted.
 
+    Results are memoized, since response tables repeat the same lines.
+
     Args:
         text: Text to analyze
 
@@ -136,17 +160,6 @@ def is_likely_code(text: str) -> bool:
     if not text or len(text.strip()) < 3:
         return False
 
-    # Check for common code indicators
-    code_indicators = [
-        '#!',  # Shebang
-        'import ', 'from ',  # Python
-        'def ', 'class ',  # Python
-        'function ', 'const ', 'let ', 'var ',  # JavaScript
-        'nmap ', 'sqlmap ', 'curl ',  # Common tools
-        '#!/',  # Script
-        '-', '--',  # Command flags (multiple)
-    ]
-
     text_lower = text.lower()
 
     # Multiple flags indicate a command
@@ -154,19 +167,12 @@ def is_likely_code(text: str) -> bool:
         return True
 
     # Check for indicators
-    if any(indicator in text_lower for indicator in code_indicators):
+    if any(indicator in text_lower for indicator in _CODE_INDICATORS):
         return True
 
     # Check if it starts with a known command
     first_word = text.strip().split()[0] if text.strip() else ''
-    common_commands = {
-        'ls', 'cd', 'pwd', 'cat', 'grep', 'find', 'chmod',
-        'chown', 'ps', 'kill', 'top', 'df', 'du', 'mount',
-        'sudo', 'su', 'apt', 'yum', 'dnf', 'pacman',
-        'git', 'docker', 'kubectl', 'npm', 'pip', 'python'
-    }
-
-    if first_word.lower() in common_commands:
+    if first_word.lower() in _COMMON_COMMANDS:
         return True
 
     return False
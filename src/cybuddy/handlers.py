@@ -3,6 +3,50 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ._keywords import compile_keyword_table, find_labels
+
+# Keyword categories for guide-mode hints, matched as substrings of the
+# lowercased input ("scanning" still counts as scan)
+_CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "scan": ("nmap", "scan", "port"),
+    "web": ("web", "http", "xss", "sql"),
+    "hash": ("hash", "crack", "password"),
+    "shell": ("shell", "reverse", "access"),
+    "finding": ("found", "discovered"),
+    "enum": ("dir", "enum", "hidden", "wordlist"),
+    "vuln": ("vuln", "nikto"),
+}
+_CATEGORY_RE = compile_keyword_table(_CATEGORY_KEYWORDS)
+
+# Ordered by priority: the first category present in the input wins
+_CONTEXTUAL_OUTPUTS = (
+    ("scan", "Start with service version detection (-sV) and document all findings"),
+    (
+        "web",
+        "Test inputs methodically, check for injection points, use Burp for inspection",
+    ),
+    (
+        "hash",
+        "Identify hash type first (hashid), then select appropriate tool and wordlist",
+    ),
+    ("shell", "Stabilize connection, enumerate privileges, look for escalation paths"),
+    (
+        "finding",
+        "Document the finding, test for related vulnerabilities, "
+        "plan next enumeration phase",
+    ),
+)
+_COMMAND_HINTS = (
+    ("scan", "nmap -sV -Pn -T2 <target>"),
+    ("enum", "gobuster dir -u http://<host> -w <wordlist>"),
+    ("vuln", "nikto -h http://<host>"),
+)
+
+
+def _classify(text: str) -> frozenset[str]:
+    """Return the keyword categories present in text, in one regex pass."""
+    return find_labels(_CATEGORY_RE, text.lower())
+
 
 @dataclass
 class GuideResponse:
@@ -38,10 +82,11 @@ def handle_user_input(text: str, session: str | None = None) -> GuideResponse:
 
     plan_text = smart_plan(text)
     action = "Follow the suggested steps below with safe defaults"
-    cmd_hint = _guide_command_hint(text)
+    categories = _classify(text)
+    cmd_hint = _guide_command_hint(text, categories)
 
     # Generate contextual output based on input
-    output = _generate_contextual_output(text)
+    output = _generate_contextual_output(text, categories)
     next_step = _extract_first_step(plan_text)
 
     return GuideResponse(
@@ -55,19 +100,15 @@ def handle_user_input(text: str, session: str | None = None) -> GuideResponse:
     )
 
 
-def _generate_contextual_output(text: str) -> str:
+def _generate_contextual_output(
+    text: str, categories: frozenset[str] | None = None
+) -> str:
     """Generate brief contextual analysis of user input."""
-    t = text.lower()
-    if any(k in t for k in ["nmap", "scan", "port"]):
-        return "Start with service version detection (-sV) and document all findings"
-    if any(k in t for k in ["web", "http", "xss", "sql"]):
-        return "Test inputs methodically, check for injection points, use Burp for inspection"
-    if any(k in t for k in ["hash", "crack", "password"]):
-        return "Identify hash type first (hashid), then select appropriate tool and wordlist"
-    if any(k in t for k in ["shell", "reverse", "access"]):
-        return "Stabilize connection, enumerate privileges, look for escalation paths"
-    if any(k in t for k in ["found", "discovered"]):
-        return "Document the finding, test for related vulnerabilities, plan next enumeration phase"
+    if categories is None:
+        categories = _classify(text)
+    for category, output in _CONTEXTUAL_OUTPUTS:
+        if category in categories:
+            return output
     return "Break down the objective, choose safe tools, document each step carefully"
 
 
@@ -225,15 +266,13 @@ def handle_slash_command(line: str, session: str | None = None) -> SlashResponse
     return SlashResponse(f"Unknown command: /{cmd}", success=False)
 
 
-def _guide_command_hint(text: str) -> str:
+def _guide_command_hint(text: str, categories: frozenset[str] | None = None) -> str:
     """Generate command hint based on user input context."""
-    t = text.lower()
-    if any(k in t for k in ["nmap", "scan", "port"]):
-        return "nmap -sV -Pn -T2 <target>"
-    if any(k in t for k in ["dir", "enum", "hidden", "wordlist"]):
-        return "gobuster dir -u http://<host> -w <wordlist>"
-    if any(k in t for k in ["vuln", "nikto"]):
-        return "nikto -h http://<host>"
+    if categories is None:
+        categories = _classify(text)
+    for category, hint in _COMMAND_HINTS:
+        if category in categories:
+            return hint
     return ""
 
 
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-import json
-from collections import Counter
+import atexit
+import re
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import cache
+from itertools import islice
 from pathlib import Path
 from typing import NamedTuple
 
+from ._json import dumpb, loads
+
+
+@cache
+def _data_dir() -> Path:
+    """Directory for the command history files, resolved once per process."""
+    return Path.home() / '.local' / 'share' / 'cybuddy'
+
 
 class CommandEntry(NamedTuple):
     """Enhanced command entry with metadata."""
@@ -16,14 +28,48 @@ class CommandEntry(NamedTuple):
 
 
 class SmartHistory:
-    """Enhanced command history with smart suggestions and analytics."""
+    """Enhanced command history with smart suggestions and analytics.
+
+    Entries are stored as an append-only JSON-lines log, one entry per line.
+    A frequency bump re-appends the entry with the same timestamp and the
+    loader folds it into the previous line. The log is compacted to the
+    last ``max_size`` entries once it grows past ``COMPACT_FACTOR`` times that.
+    """
+
+    # Number of adds buffered in memory before they are appended to the log
+    SAVE_EVERY = 16
+    COMPACT_FACTOR = 2
     
     def __init__(self, max_size: int = 1000):
-        self.history_file = Path.home() / '.local' / 'share' / 'cybuddy' / 'history.json'
+        data_dir = _data_dir()
+        self.history_file = data_dir / 'commands.jsonl'
+        # Pre-log format: a single JSON document rewritten on every save
+        self.legacy_history_file = data_dir / 'history.json'
         self.max_size = max_size
-        self.history = self.load()
+        self._log_lines = 0
+        self._pending: list[bytes] = []
+        # Loaded from disk on first access, so constructing is free; bounded
+        # to max_size, evicting the oldest entry on append
+        self._history: deque[CommandEntry] | None = None
         self._command_patterns = self._build_command_patterns()
+        # One compiled alternation per category, checked in pattern order
+        self._category_res = {
+            category: re.compile("|".join(map(re.escape, patterns)))
+            for category, patterns in self._command_patterns.items()
+        }
+        self._flush_registered = False
     
+    @property
+    def history(self) -> deque[CommandEntry]:
+        """Entries in order, read from the log the first time they are needed."""
+        if self._history is None:
+            self._history = deque(self.load(), maxlen=self.max_size)
+        return self._history
+
+    @history.setter
+    def history(self, entries: Iterable[CommandEntry]) -> None:
+        self._history = deque(entries, maxlen=self.max_size)
+
     def _build_command_patterns(self) -> dict[str, list[str]]:
         """Build patterns for smart command categorization."""
         return {
@@ -40,12 +86,13 @@ class SmartHistory:
         """Categorize command based on patterns."""
         cmd_lower = command.lower()
         
-        for category, patterns in self._command_patterns.items():
-            if any(pattern in cmd_lower for pattern in patterns):
+        for category, pattern_re in self._category_res.items():
+            if pattern_re.search(cmd_lower):
                 return category
         
         # Default categorization based on first word
-        first_word = command.split()[0] if command.split() else "unknown"
+        words = command.split()
+        first_word = words[0] if words else "unknown"
         return first_word if first_word in self._command_patterns else "other"
     
     def _extract_tools_and_techniques(self, command: str) -> list[str]:
@@ -77,35 +124,86 @@ class SmartHistory:
         return found_items
     
     def load(self) -> list[CommandEntry]:
-        """Load history from file with enhanced metadata."""
+        """Load history from the log, migrating the old JSON file if needed."""
+        entries: list[CommandEntry]
         if not self.history_file.exists():
+            entries = self._load_legacy()
+            if entries:
+                self.history = entries
+                try:
+                    self.save()
+                except OSError:
+                    pass  # Read-only data dir: keep the legacy file, retry next run
+            return entries
+
+        entries = []
+        lines = 0
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = CommandEntry(**loads(line))
+                    except (ValueError, TypeError):
+                        continue  # Skip a corrupt or truncated line
+                    if (entries and entries[-1].command == entry.command
+                            and entries[-1].timestamp == entry.timestamp):
+                        entries[-1] = entry  # Frequency bump of the last entry
+                    else:
+                        entries.append(entry)
+        except OSError:
+            return []
+        self._log_lines = lines
+        return entries
+
+    def _load_legacy(self) -> list[CommandEntry]:
+        """Read the pre-log history.json format, if present."""
+        if not self.legacy_history_file.exists():
             return []
         
         try:
-            with open(self.history_file) as f:
-                data = json.load(f)
-                commands = data.get('commands', [])
-                
-                # Convert old format to new format
-                if commands and isinstance(commands[0], str):
-                    # Migrate from old format
-                    return [CommandEntry(cmd, datetime.now().isoformat()) for cmd in commands]
-                
-                # Load new format
-                return [CommandEntry(**cmd) for cmd in commands]
-        except (json.JSONDecodeError, FileNotFoundError, TypeError):
+            data = loads(self.legacy_history_file.read_bytes())
+            commands = data.get('commands', [])
+            
+            # Convert old format to new format
+            if commands and isinstance(commands[0], str):
+                # Migrate from old format
+                return [CommandEntry(cmd, datetime.now().isoformat()) for cmd in commands]
+            
+            # Load new format
+            return [CommandEntry(**cmd) for cmd in commands]
+        except (ValueError, FileNotFoundError, TypeError):
             return []
     
     def save(self) -> None:
-        """Save history to file with enhanced metadata."""
+        """Compact the log to the last max_size entries."""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.history_file, 'w') as f:
-            json.dump({
-                'commands': [cmd._asdict() for cmd in self.history[-self.max_size:]],
-                'last_updated': datetime.now().isoformat(),
-                'version': '2.0'
-            }, f, indent=2)
+        with open(self.history_file, 'wb') as f:
+            f.writelines(dumpb(cmd._asdict()) + b"\n" for cmd in self.history)
+        self._log_lines = len(self.history)
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Append any entries still buffered in memory to the log."""
+        if not self._pending:
+            return
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, 'ab', buffering=8192) as f:
+            f.writelines(self._pending)
+        self._log_lines += len(self._pending)
+        self._pending.clear()
+        if self._log_lines > self.COMPACT_FACTOR * self.max_size:
+            self.save()
+
+    def _schedule_save(self, entry: CommandEntry) -> None:
+        """Buffer entry for the log; flushed every SAVE_EVERY adds and at exit."""
+        self._pending.append(dumpb(entry._asdict()) + b"\n")
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+        if len(self._pending) >= self.SAVE_EVERY:
+            self.flush()
     
     def add(self, command: str) -> None:
         """Add command to history with smart deduplication and categorization."""
@@ -115,9 +213,9 @@ class SmartHistory:
         # Check for exact duplicate
         if self.history and self.history[-1].command == command:
             # Update frequency instead of adding duplicate
-            entry = self.history[-1]
-            self.history[-1] = entry._replace(frequency=entry.frequency + 1)
-            self.save()
+            entry = self.history[-1]._replace(frequency=self.history[-1].frequency + 1)
+            self.history[-1] = entry
+            self._schedule_save(entry)
             return
         
         # Create new entry with metadata
@@ -130,13 +228,16 @@ class SmartHistory:
         )
         
         self.history.append(entry)
-        self.save()
+        self._schedule_save(entry)
     
     def clear(self) -> None:
         """Clear history."""
         self.history = []
-        if self.history_file.exists():
-            self.history_file.unlink()
+        self._pending.clear()
+        self._log_lines = 0
+        for path in (self.history_file, self.legacy_history_file):
+            if path.exists():
+                path.unlink()
     
     def get_history(self) -> list[str]:
         """Get all history entries as strings."""
@@ -144,17 +245,25 @@ class SmartHistory:
     
     def get_enhanced_history(self) -> list[CommandEntry]:
         """Get all history entries with metadata."""
-        return self.history.copy()
+        return list(self.history)
     
     def search(self, query: str) -> list[str]:
         """Search history for commands containing query."""
-        return [entry.command for entry in self.history if query.lower() in entry.command.lower()]
+        return list(self.iter_search(query))
+
+    def iter_search(self, query: str, newest_first: bool = False) -> Iterator[str]:
+        """Yield commands containing query without building a list."""
+        query_lower = query.lower()
+        entries = reversed(self.history) if newest_first else iter(self.history)
+        for entry in entries:
+            if query_lower in entry.command.lower():
+                yield entry.command
     
     def get_smart_suggestions(self, current_input: str = "", limit: int = 5) -> list[str]:
         """Generate smart suggestions based on current input and history patterns."""
         if not current_input.strip():
             # Return most frequent recent commands
-            recent_entries = self.history[-20:] if len(self.history) > 20 else self.history
+            recent_entries = list(islice(reversed(self.history), 20))[::-1]
             frequency_map = Counter(entry.command for entry in recent_entries)
             return [cmd for cmd, _ in frequency_map.most_common(limit)]
         
@@ -250,6 +359,9 @@ class CommandHistory:
         return self._smart_history.search(query)
 
 
+# Maximum number of matches shown by history --search
+SEARCH_LIMIT = 200
+
 # Global history instance
 _history_instance: SmartHistory | None = None
 
@@ -280,3 +392,8 @@ def get_history_entries() -> list[str]:
 def search_history(query: str) -> list[str]:
     """Search history for commands containing query."""
     return get_history().search(query)
+
+
+def iter_search_history(query: str, limit: int | None = None) -> Iterator[str]:
+    """Lazily yield commands containing query, newest first, up to limit."""
+    return islice(get_history().iter_search(query, newest_first=True), limit)
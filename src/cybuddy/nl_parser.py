@@ -17,12 +17,15 @@ from __future__ import annotations
 
 import re
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import json
 from pathlib import Path
 
+from ._keywords import compile_keyword_table, find_labels
+
 # Import thefuzz for enhanced fuzzy matching
 try:
     from thefuzz import fuzz, process
@@ -483,6 +486,32 @@ class PerformanceMonitor:
         
         return stats
 
+
+# Names classified without falling back to substring patterns
+_KNOWN_TOOLS = frozenset({
+    'nmap', 'masscan', 'rustscan', 'wireshark', 'tcpdump', 'tshark', 'termshark',
+    'unicornscan', 'naabu', 'netcat', 'ncat', 'socat', 'proxychains', 'dig',
+    'dnsenum', 'fierce', 'ettercap', 'bettercap', 'arpspoof', 'responder',
+    'volatility', 'rekall', 'lime', 'autopsy', 'sleuthkit', 'ftk', 'dd',
+    'binwalk', 'exiftool', 'strings', 'foremost', 'networkminer', 'xplico',
+    'andriller', 'aleapp', 'ghidra', 'ida', 'radare2', 'binaryninja', 'gdb',
+    'pwndbg', 'x64dbg', 'edb', 'objdump', 'readelf', 'nm', 'file', 'ltrace',
+    'strace', 'frida', 'burp', 'gobuster', 'ffuf', 'nikto', 'dirb', 'wpscan',
+    'sqlmap', 'metasploit', 'msfvenom', 'john', 'hashcat', 'hydra', 'aircrack-ng',
+    'hashid', 'hash-identifier', 'openssl', 'linpeas', 'winpeas', 'sudo'
+})
+_KNOWN_TECHNIQUES = frozenset({
+    'kerberoasting', 'pass-the-hash', 'pass-the-ticket', 'golden-ticket',
+    'dcsync', 'ssrf', 'xxe', 'deserialization', 'ssti', 'http-smuggling',
+    'suid-exploitation', 'sudo-misconfig', 'kernel-exploits', 'token-impersonation',
+    'dll-hijacking', 'arp-spoofing', 'dns-spoofing', 'vlan-hopping', 'ipv6-mitm',
+    'smb-relay', 'sql injection', 'xss', 'csrf', 'lfi', 'rfi', 'rce',
+    'privilege escalation', 'buffer overflow', 'format string', 'port scanning',
+    'service enumeration', 'vulnerability scanning', 'post-exploitation',
+    'lateral movement', 'credential reuse'
+})
+
+
 class DataDrivenKnowledgeBase:
     """High-performance cybersecurity knowledge base using data.py with singleton pattern."""
     
@@ -526,12 +555,12 @@ class DataDrivenKnowledgeBase:
         self._entity_cache: Dict[str, Optional[Entity]] = {}
         
         # Data.py integration
-        self._explain_db: Optional[Dict] = None
-        self._tip_db: Optional[Dict] = None
-        self._assist_db: Optional[Dict] = None
-        self._report_db: Optional[Dict] = None
-        self._quiz_db: Optional[Dict] = None
-        self._plan_db: Optional[Dict] = None
+        self._explain_db: Mapping[str, Mapping[str, str]] | None = None
+        self._tip_db: Mapping[str, str] | None = None
+        self._assist_db: Mapping[str, str] | None = None
+        self._report_db: Mapping[str, str] | None = None
+        self._quiz_db: Mapping[str, str] | None = None
+        self._plan_db: Mapping[str, str] | None = None
         
         # Mark as initialized
         self._initialized = True
@@ -777,36 +806,12 @@ class DataDrivenKnowledgeBase:
         """Classify entity type based on name patterns."""
         name_lower = name.lower()
         
-        # Known tools from data.py (most common first)
-        known_tools = {
-            'nmap', 'masscan', 'rustscan', 'wireshark', 'tcpdump', 'tshark', 'termshark',
-            'unicornscan', 'naabu', 'netcat', 'ncat', 'socat', 'proxychains', 'dig',
-            'dnsenum', 'fierce', 'ettercap', 'bettercap', 'arpspoof', 'responder',
-            'volatility', 'rekall', 'lime', 'autopsy', 'sleuthkit', 'ftk', 'dd',
-            'binwalk', 'exiftool', 'strings', 'foremost', 'networkminer', 'xplico',
-            'andriller', 'aleapp', 'ghidra', 'ida', 'radare2', 'binaryninja', 'gdb',
-            'pwndbg', 'x64dbg', 'edb', 'objdump', 'readelf', 'nm', 'file', 'ltrace',
-            'strace', 'frida', 'burp', 'gobuster', 'ffuf', 'nikto', 'dirb', 'wpscan',
-            'sqlmap', 'metasploit', 'msfvenom', 'john', 'hashcat', 'hydra', 'aircrack-ng',
-            'hashid', 'hash-identifier', 'openssl', 'linpeas', 'winpeas', 'sudo'
-        }
-        
-        if name_lower in known_tools:
+        # Known tools from data.py
+        if name_lower in _KNOWN_TOOLS:
             return EntityType.TOOL
         
         # Known techniques
-        known_techniques = {
-            'kerberoasting', 'pass-the-hash', 'pass-the-ticket', 'golden-ticket',
-            'dcsync', 'ssrf', 'xxe', 'deserialization', 'ssti', 'http-smuggling',
-            'suid-exploitation', 'sudo-misconfig', 'kernel-exploits', 'token-impersonation',
-            'dll-hijacking', 'arp-spoofing', 'dns-spoofing', 'vlan-hopping', 'ipv6-mitm',
-            'smb-relay', 'sql injection', 'xss', 'csrf', 'lfi', 'rfi', 'rce',
-            'privilege escalation', 'buffer overflow', 'format string', 'port scanning',
-            'service enumeration', 'vulnerability scanning', 'post-exploitation',
-            'lateral movement', 'credential reuse'
-        }
-        
-        if name_lower in known_techniques:
+        if name_lower in _KNOWN_TECHNIQUES:
             return EntityType.TECHNIQUE
         
         # Tool patterns (fallback)
@@ -1336,6 +1341,42 @@ class IntentClassifier:
 # Context Extraction and Understanding
 # ============================================================================
 
+# Keyword tables for context analysis, in reporting order, matched as
+# substrings of the lowercased query
+_DOMAIN_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "web": (
+        "web", "http", "https", "xss", "sqli", "csrf", "burp", "nikto", "gobuster",
+    ),
+    "network": (
+        "network", "port", "scan", "nmap", "masscan", "wireshark", "tcpdump",
+    ),
+    "forensics": ("forensic", "memory", "disk", "image", "pcap", "timeline"),
+    "crypto": ("crypto", "hash", "encrypt", "decrypt", "john", "hashcat"),
+    "mobile": ("mobile", "android", "ios", "app", "apk", "ipa"),
+    "wireless": ("wireless", "wifi", "bluetooth", "aircrack", "reaver"),
+    "reversing": ("reverse", "malware", "binary", "disassembly", "ida", "ghidra"),
+}
+_SCENARIO_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "discovery": ("found", "discovered", "see", "detected"),
+    "troubleshooting": ("not working", "error", "problem", "stuck", "failing"),
+    "learning": ("learn", "understand", "explain", "teach"),
+    "planning": ("next", "after", "should", "plan", "strategy"),
+    "reporting": ("document", "report", "write", "summarize"),
+}
+
+
+_DOMAIN_RE = compile_keyword_table(_DOMAIN_KEYWORDS)
+_SCENARIO_RE = compile_keyword_table(_SCENARIO_KEYWORDS)
+
+
+def _detect_labels(
+    table: dict[str, tuple[str, ...]], pattern: re.Pattern[str], text: str
+) -> list[str]:
+    """Return the table labels whose keywords occur in text, in table order."""
+    found = find_labels(pattern, text)
+    return [label for label in table if label in found]
+
+
 class ContextExtractor:
     """Extract and analyze context from user queries."""
     
@@ -1381,22 +1422,7 @@ class ContextExtractor:
     
     def _analyze_domain_context(self, query: str) -> Dict[str, Any]:
         """Analyze domain context (what cybersecurity area)."""
-        query_lower = query.lower()
-        
-        domains = {
-            "web": ["web", "http", "https", "xss", "sqli", "csrf", "burp", "nikto", "gobuster"],
-            "network": ["network", "port", "scan", "nmap", "masscan", "wireshark", "tcpdump"],
-            "forensics": ["forensic", "memory", "disk", "image", "pcap", "timeline"],
-            "crypto": ["crypto", "hash", "encrypt", "decrypt", "john", "hashcat"],
-            "mobile": ["mobile", "android", "ios", "app", "apk", "ipa"],
-            "wireless": ["wireless", "wifi", "bluetooth", "aircrack", "reaver"],
-            "reversing": ["reverse", "malware", "binary", "disassembly", "ida", "ghidra"],
-        }
-        
-        detected_domains = []
-        for domain, keywords in domains.items():
-            if any(keyword in query_lower for keyword in keywords):
-                detected_domains.append(domain)
+        detected_domains = _detect_labels(_DOMAIN_KEYWORDS, _DOMAIN_RE, query.lower())
         
         return {
             "domains": detected_domains,
@@ -1428,36 +1454,27 @@ class ContextExtractor:
     
     def _extract_tools(self, query: str) -> List[str]:
         """Extract mentioned tools."""
+        query_lower = query.lower()
         tools = []
         for tool_name, entity in self.knowledge_base.tools.items():
-            if tool_name in query.lower() or any(alias in query.lower() for alias in entity.aliases):
+            if tool_name in query_lower or any(alias in query_lower for alias in entity.aliases):
                 tools.append(tool_name)
         return tools
     
     def _extract_techniques(self, query: str) -> List[str]:
         """Extract mentioned techniques."""
+        query_lower = query.lower()
         techniques = []
         for tech_name, entity in self.knowledge_base.techniques.items():
-            if tech_name in query.lower() or any(alias in query.lower() for alias in entity.aliases):
+            if tech_name in query_lower or any(alias in query_lower for alias in entity.aliases):
                 techniques.append(tech_name)
         return techniques
     
     def _analyze_scenario(self, query: str) -> Dict[str, Any]:
         """Analyze the scenario/situation described."""
-        query_lower = query.lower()
-        
-        scenarios = {
-            "discovery": ["found", "discovered", "see", "detected"],
-            "troubleshooting": ["not working", "error", "problem", "stuck", "failing"],
-            "learning": ["learn", "understand", "explain", "teach"],
-            "planning": ["next", "after", "should", "plan", "strategy"],
-            "reporting": ["document", "report", "write", "summarize"],
-        }
-        
-        detected_scenarios = []
-        for scenario, keywords in scenarios.items():
-            if any(keyword in query_lower for keyword in keywords):
-                detected_scenarios.append(scenario)
+        detected_scenarios = _detect_labels(
+            _SCENARIO_KEYWORDS, _SCENARIO_RE, query.lower()
+        )
         
         return {
             "scenarios": detected_scenarios,
@@ -1973,6 +1990,22 @@ def extract_topic(text: str) -> str:
     return text_lower.strip()
 
 
+# Direct-command prefixes, checked with a single str.startswith(tuple) call
+_COMMAND_PREFIXES = tuple(
+    f"{cmd} " for cmd in ('explain', 'tip', 'help', 'report', 'quiz', 'plan', 'assist')
+)
+
+# Tool names that mark input as direct tool usage when they lead the query
+_TOOL_KEYWORDS = frozenset({
+    'nmap', 'burp', 'sqlmap', 'metasploit', 'wireshark',
+    'hydra', 'john', 'hashcat', 'gobuster', 'ffuf',
+    'nikto', 'dirb', 'wfuzz', 'netcat', 'nc', 'ssh',
+    'tcpdump', 'masscan', 'enum4linux', 'smbclient'
+})
+
+_QUESTION_WORDS = ('how', 'what', 'why', 'when', 'where', 'which')
+
+
 def is_natural_language(text: str) -> bool:
     """
     Determine if text is a natural language query vs a direct command using enhanced detection.
@@ -1987,29 +2020,16 @@ def is_natural_language(text: str) -> bool:
     text_lower = text.lower().strip()
     
     # Direct commands start with known command words
-    command_words = ['explain', 'tip', 'help', 'report', 'quiz', 'plan', 'assist']
-    if any(text_lower.startswith(cmd + ' ') for cmd in command_words):
+    if text_lower.startswith(_COMMAND_PREFIXES):
         return False
     
     # Direct tool usage (tool name followed by flags/args)
-    tool_keywords = [
-        'nmap', 'burp', 'sqlmap', 'metasploit', 'wireshark',
-        'hydra', 'john', 'hashcat', 'gobuster', 'ffuf',
-        'nikto', 'dirb', 'wfuzz', 'netcat', 'nc', 'ssh',
-        'tcpdump', 'masscan', 'enum4linux', 'smbclient'
-    ]
-    
     words = text_lower.split()
-    if words and words[0] in tool_keywords:
+    if words and words[0] in _TOOL_KEYWORDS:
         return False
     
-    # Enhanced natural language indicators
-    question_words = ['how', 'what', 'why', 'when', 'where', 'which']
-    if any(text_lower.startswith(word) for word in question_words):
-        return True
-    
-    # Contains question words anywhere
-    if any(word in text_lower for word in question_words):
+    # Question words anywhere (a leading one is found at offset 0)
+    if any(word in text_lower for word in _QUESTION_WORDS):
         return True
     
     # Enhanced natural language patterns
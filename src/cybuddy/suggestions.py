@@ -5,6 +5,76 @@ Provides intelligent suggestions for typos and similar commands/tools.
 """
 
 from difflib import get_close_matches
+from functools import lru_cache
+
+
+def _char_mask(text: str) -> int:
+    """Bitmask of the characters in text: a-z, 0-9, plus one bit for anything else."""
+    mask = 0
+    for ch in text:
+        if "a" <= ch <= "z":
+            mask |= 1 << (ord(ch) - 97)
+        elif "0" <= ch <= "9":
+            mask |= 1 << (ord(ch) - 22)
+        else:
+            mask |= 1 << 36
+    return mask
+
+
+@lru_cache(maxsize=32)
+def _candidate_meta(items: tuple[str, ...]) -> tuple[tuple[str, int, int], ...]:
+    """Length and character mask of each candidate, computed once per corpus."""
+    return tuple((item, len(item), _char_mask(item)) for item in items)
+
+
+def _prefilter(query: str, items: tuple[str, ...], cutoff: float) -> list[str]:
+    """
+    Drop candidates that cannot reach cutoff before difflib scores them.
+
+    A query character absent from a candidate can never be matched, so the
+    match count is at most the query length minus the number of such
+    distinct characters (and at most the candidate length). That bound on
+    difflib's 2*M/T ratio is exact to compute from the precomputed masks,
+    so the surviving candidates give the same result as the full list.
+    """
+    query_len = len(query)
+    query_mask = _char_mask(query)
+    survivors = []
+    for item, item_len, item_mask in _candidate_meta(items):
+        total = query_len + item_len
+        if total:
+            best = min(query_len - (query_mask & ~item_mask).bit_count(), item_len)
+            if 2.0 * best / total < cutoff:
+                continue
+        survivors.append(item)
+    return survivors
+
+
+@lru_cache(maxsize=32)
+def _case_index(items: tuple[str, ...]) -> dict[str, str]:
+    """Map each lowercased item to its first original spelling, once per corpus."""
+    index: dict[str, str] = {}
+    for item in items:
+        index.setdefault(item.lower(), item)
+    return index
+
+
+def _close_originals(
+    query: str,
+    items: list[str],
+    max_suggestions: int,
+    cutoff: float
+) -> list[str]:
+    """Fuzzy-match query case-insensitively, returning the items' original case."""
+    index = _case_index(tuple(items))
+    query_lower = query.lower().strip()
+    matches = get_close_matches(
+        query_lower,
+        _prefilter(query_lower, tuple(index), cutoff),
+        n=max_suggestions,
+        cutoff=cutoff
+    )
+    return [index[match] for match in matches]
 
 
 def get_tool_suggestions(
@@ -32,28 +102,7 @@ def get_tool_suggestions(
         >>> get_tool_suggestions("netct", tools)
         ['netcat']
     """
-    # Normalize for better matching
-    tool_name_lower = tool_name.lower().strip()
-    available_tools_lower = [tool.lower() for tool in available_tools]
-
-    # Get close matches
-    matches = get_close_matches(
-        tool_name_lower,
-        available_tools_lower,
-        n=max_suggestions,
-        cutoff=cutoff
-    )
-
-    # Return original case versions
-    suggestions = []
-    for match in matches:
-        # Find original case version
-        for original in available_tools:
-            if original.lower() == match:
-                suggestions.append(original)
-                break
-
-    return suggestions
+    return _close_originals(tool_name, available_tools, max_suggestions, cutoff)
 
 
 def get_command_suggestions(
@@ -87,7 +136,7 @@ def get_command_suggestions(
     # Get close matches
     matches = get_close_matches(
         command_lower,
-        valid_commands,
+        _prefilter(command_lower, tuple(valid_commands), cutoff),
         n=max_suggestions,
         cutoff=cutoff
     )
@@ -123,27 +172,7 @@ def get_category_suggestions(
         >>> get_category_suggestions("net", categories)
         ['network_scan']
     """
-    # Normalize for better matching
-    query_lower = query.lower().strip()
-    categories_lower = [cat.lower() for cat in categories]
-
-    # Get close matches
-    matches = get_close_matches(
-        query_lower,
-        categories_lower,
-        n=max_suggestions,
-        cutoff=cutoff
-    )
-
-    # Return original case versions
-    suggestions = []
-    for match in matches:
-        for original in categories:
-            if original.lower() == match:
-                suggestions.append(original)
-                break
-
-    return suggestions
+    return _close_originals(query, categories, max_suggestions, cutoff)
 
 
 def get_technique_suggestions(
@@ -171,27 +200,7 @@ def get_technique_suggestions(
         >>> get_technique_suggestions("cross site", techniques)
         ['XSS', 'CSRF']
     """
-    # Normalize for better matching
-    query_lower = query.lower().strip()
-    techniques_lower = [tech.lower() for tech in techniques]
-
-    # Get close matches
-    matches = get_close_matches(
-        query_lower,
-        techniques_lower,
-        n=max_suggestions,
-        cutoff=cutoff
-    )
-
-    # Return original case versions
-    suggestions = []
-    for match in matches:
-        for original in techniques:
-            if original.lower() == match:
-                suggestions.append(original)
-                break
-
-    return suggestions
+    return _close_originals(query, techniques, max_suggestions, cutoff)
 
 
 def find_partial_matches(
@@ -3,6 +3,19 @@
 This package mirrors the Codex CLI TUI architecture using Python libraries.
 """
 
-from .simple import SimpleTUI
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .simple import SimpleTUI
 
 __all__ = ["SimpleTUI"]
+
+
+def __getattr__(name: str) -> object:
+    # Resolve SimpleTUI on first access so importing a light submodule
+    # (e.g. tui.logo) does not pull in prompt_toolkit and the app stack.
+    if name == "SimpleTUI":
+        from .simple import SimpleTUI
+
+        return SimpleTUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
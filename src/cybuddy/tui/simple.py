@@ -1,32 +1,236 @@
 """Simple TUI using prompt_toolkit's proper async API with smart suggestions."""
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+from itertools import chain
+
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.history import FileHistory, InMemoryHistory
 from prompt_toolkit.patch_stdout import patch_stdout
-from rich.console import Console
+from rich.console import Console, RenderableType
 
 from ..cli import (
+    _app_dir,
     explain_command,
     help_troubleshoot,
     history_append,
+    history_flush,
+    load_config,
     micro_report,
     quick_tip,
     quiz_flashcards,
     step_planner,
 )
-from ..history import get_history
+from ..history import SEARCH_LIMIT, SmartHistory, get_history
+
+# Shield logo with green-to-cyan gradient and medical cross, matching the SVG
+# design rgb(0,255,136) -> rgb(0,255,255); pre-joined so it is one write
+_LOGO = "\n".join([
+    "\033[1;38;2;0;255;136m        ▄▀▀▀▄\033[0m",
+    "\033[1;38;2;0;255;150m       █  │  █\033[0m",
+    "\033[1;38;2;0;255;170m      █ ──┼── █\033[0m      \033[1;97mCY\033[1;38;2;0;255;255mBUDDY\033[0m",
+    "\033[1;38;2;0;255;190m      █   │   █\033[0m",
+    "\033[1;38;2;0;255;210m       █     █\033[0m       \033[2mYour Security Learning Companion\033[0m",
+    "\033[1;38;2;0;255;230m        █   █\033[0m",
+    "\033[1;38;2;0;255;245m         █ █\033[0m",
+    "\033[1;38;2;0;255;255m          ▀\033[0m",
+]) + "\n\n"
+# Same logo without escape sequences, for redirected output and NO_COLOR
+_LOGO_PLAIN = re.sub(r"\033\[[0-9;]*m", "", _LOGO)
+
+# Student-helper commands: handler, response title and usage hint
+_HELPERS = {
+    "explain": (explain_command, "Explanation", "explain '<command>'"),
+    "tip": (quick_tip, "Tip", "tip '<topic>'"),
+    "help": (help_troubleshoot, "Troubleshooting", "help '<error message>'"),
+    "assist": (help_troubleshoot, "Troubleshooting", "help '<error message>'"),
+    "report": (micro_report, "Report Template", "report '<finding>'"),
+    "quiz": (quiz_flashcards, "Quiz", "quiz '<topic>'"),
+    "plan": (step_planner, "Next Steps", "plan '<context>'"),
+}
+
+
+# Command words in display order, and every prefix of them mapped to the
+# commands it can complete to (a flattened trie: one dict lookup per prefix)
+_COMMAND_NAMES = (
+    "explain", "tip", "help", "assist", "report",
+    "quiz", "plan", "history", "clear", "exit",
+)
+
+
+def _build_prefix_index(names: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Map every prefix of each name to the names sharing it, in order."""
+    index: dict[str, tuple[str, ...]] = {}
+    for name in names:
+        for end in range(1, len(name) + 1):
+            index[name[:end]] = index.get(name[:end], ()) + (name,)
+    return index
+
+
+_COMMAND_PREFIXES = _build_prefix_index(_COMMAND_NAMES)
+
+
+# Common completion queries per command, offered after the command word
+_COMMAND_SUGGESTIONS: dict[str, tuple[str, ...]] = {
+    "explain": (
+        "nmap -sV", "burp suite", "sqlmap", "metasploit", "wireshark",
+        "hydra", "john the ripper", "gobuster", "nikto", "netcat"
+    ),
+    "tip": (
+        "sql injection", "xss", "csrf", "privilege escalation", "buffer overflow",
+        "network scanning", "password cracking", "web application testing"
+    ),
+    "help": (
+        "connection refused", "permission denied", "command not found",
+        "port already in use", "authentication failed"
+    ),
+    "report": (
+        "found sql injection", "discovered open ports", "identified vulnerabilities",
+        "completed penetration test", "security assessment findings"
+    ),
+    "quiz": (
+        "sql injection", "network protocols", "cryptography", "web security",
+        "penetration testing", "forensics", "incident response"
+    ),
+    "plan": (
+        "found open port 80", "discovered sql injection", "got initial access",
+        "identified admin panel", "found credentials"
+    ),
+    "clear": (),  # Clear command doesn't need suggestions
+}
+
+
+# Fast paths for splitting command lines the way shlex.split does: plain
+# words, or a command followed by one quoted argument. Anything with other
+# quoting or backslashes still goes through shlex.
+_WHITESPACE = r" \t\r\n"  # The characters shlex splits on
+_TOKEN_RE = re.compile(rf"[^{_WHITESPACE}]+")
+_SHELL_SPECIAL_RE = re.compile(r"['\"\\]")
+_QUOTED_ARG_RE = re.compile(
+    rf"[{_WHITESPACE}]*([^{_WHITESPACE}'\"\\]+)[{_WHITESPACE}]+"
+    r"(['\"])([^'\"\\]*)\2"
+    rf"[{_WHITESPACE}]*"
+)
+
+
+def _split_command(text: str) -> list[str]:
+    """Split a command line into words with shell-like quoting."""
+    if _SHELL_SPECIAL_RE.search(text) is None:
+        return _TOKEN_RE.findall(text)
+    match = _QUOTED_ARG_RE.fullmatch(text)
+    if match:
+        return [match.group(1), match.group(3)]
+
+    import shlex
+
+    try:
+        return shlex.split(text)
+    except ValueError:
+        # Fallback for unclosed quotes
+        return text.split()
+
+
+def _prompt_history() -> FileHistory | InMemoryHistory:
+    """Return persistent input history; in memory if disabled or unwritable."""
+    if not load_config().get("history.enabled", True):
+        return InMemoryHistory()
+    path = _app_dir() / "prompt_history"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return InMemoryHistory()
+    return FileHistory(str(path))
+
+
+def _preload_history() -> None:
+    """Read the command history log so the first completion does not wait."""
+    _ = get_history().history  # First access loads and caches the entries
+
+
+def _warm_imports() -> None:
+    """Import the response tables and NL parser ahead of the first command."""
+    from .. import data, nl_parser  # noqa: F401
+
+
+_GOODBYE = "[green]Good luck! Document your steps and be safe.[/green]"
+_RESPONSE_FOOTER = "[bold yellow]" + "─" * 60 + "[/bold yellow]"
+
+
+# Helper responses are memoized per argument, so the same content comes
+# back often; its layout and Syntax renderables are cached alongside.
+@lru_cache(maxsize=128)
+def _response_renderables(title: str, content: str) -> tuple[RenderableType, ...]:
+    """Lay out a response once: title border, indented text, highlighted code."""
+    from ..formatters import create_syntax_highlight, is_likely_code
+
+    # Top border with title
+    border_len = 50 - len(title)
+    parts: list[RenderableType] = [
+        f"[bold yellow]─── {title} {'─' * border_len}[/bold yellow]"
+    ]
+
+    # Content with 2-space indent and syntax highlighting for code blocks
+    lines = content.split("\n")
+    code_buffer = []
+    in_code_block = False
+
+    for line in lines:
+        # Detect potential code lines (start with common commands or have flags)
+        if is_likely_code(line.strip()) and not in_code_block:
+            in_code_block = True
+            code_buffer = [line]
+        elif in_code_block:
+            # Continue code block if line looks like code or is empty
+            if is_likely_code(line.strip()) or not line.strip():
+                code_buffer.append(line)
+            else:
+                # End code block and emit it
+                if code_buffer:
+                    code_text = "\n".join(code_buffer)
+                    syntax = create_syntax_highlight(code_text, line_numbers=False)
+                    parts.append(syntax)
+                    code_buffer = []
+                in_code_block = False
+                # Emit current line as regular text
+                if line.strip():
+                    parts.append(f"  {line}")
+                else:
+                    parts.append("")
+        else:
+            # Regular text line
+            if line.strip():
+                parts.append(f"  {line}")
+            else:
+                parts.append("")
+
+    # Emit any remaining code buffer
+    if code_buffer:
+        code_text = "\n".join(code_buffer)
+        syntax = create_syntax_highlight(code_text, line_numbers=False)
+        parts.append(syntax)
+
+    # Bottom border
+    parts.append(_RESPONSE_FOOTER)
+    return tuple(parts)
 
 
 class SmartCompleter(Completer):
     """Smart command completer with history-based suggestions."""
     
     def __init__(self):
-        self.history = get_history()
-        self.base_commands = [
-            "explain", "tip", "help", "assist", "report", "quiz", "plan", "history", "clear", "exit"
-        ]
+        self.base_commands = list(_COMMAND_NAMES)
     
+    @property
+    def history(self) -> SmartHistory:
+        """Shared history, resolved on use so loading can overlap startup."""
+        return get_history()
+
     def get_completions(self, document, complete_event):
         """Provide smart completions based on context and history."""
         text = document.text_before_cursor
@@ -55,8 +259,8 @@ class SmartCompleter(Completer):
             else:
                 # Suggest based on partial input
                 partial = " ".join(words[1:])
-                suggestions = self.history.get_smart_suggestions(partial, limit=5)
-                for suggestion in suggestions:
+                matches = self.history.get_smart_suggestions(partial, limit=5)
+                for suggestion in matches:
                     # Calculate start position to replace the entire current text
                     start_pos = -len(text)
                     yield Completion(
@@ -68,42 +272,19 @@ class SmartCompleter(Completer):
         else:
             # Suggest base commands - replace only the current word
             current_word = words[0]
-            for cmd in self.base_commands:
-                if cmd.startswith(current_word.lower()):
-                    # Calculate start position to replace only the current word
-                    start_pos = -len(current_word)
-                    yield Completion(cmd, start_position=start_pos, display=cmd, style="class:completion")
+            for cmd in _COMMAND_PREFIXES.get(current_word.lower(), ()):
+                # Calculate start position to replace only the current word
+                start_pos = -len(current_word)
+                yield Completion(
+                    cmd,
+                    start_position=start_pos,
+                    display=cmd,
+                    style="class:completion",
+                )
     
-    def _get_command_suggestions(self, command: str) -> list[str]:
+    def _get_command_suggestions(self, command: str) -> tuple[str, ...]:
         """Get common suggestions for specific commands."""
-        suggestions = {
-            "explain": [
-                "nmap -sV", "burp suite", "sqlmap", "metasploit", "wireshark",
-                "hydra", "john the ripper", "gobuster", "nikto", "netcat"
-            ],
-            "tip": [
-                "sql injection", "xss", "csrf", "privilege escalation", "buffer overflow",
-                "network scanning", "password cracking", "web application testing"
-            ],
-            "help": [
-                "connection refused", "permission denied", "command not found",
-                "port already in use", "authentication failed"
-            ],
-            "report": [
-                "found sql injection", "discovered open ports", "identified vulnerabilities",
-                "completed penetration test", "security assessment findings"
-            ],
-            "quiz": [
-                "sql injection", "network protocols", "cryptography", "web security",
-                "penetration testing", "forensics", "incident response"
-            ],
-            "plan": [
-                "found open port 80", "discovered sql injection", "got initial access",
-                "identified admin panel", "found credentials"
-            ],
-            "clear": []  # Clear command doesn't need suggestions
-        }
-        return suggestions.get(command, [])
+        return _COMMAND_SUGGESTIONS.get(command, ())
 
 
 class SimpleTUI:
@@ -121,78 +302,97 @@ class SimpleTUI:
         "clear": "Clear the terminal screen",
         "exit": "Exit Cybuddy",
     }
+    # Pre-joined once for the unknown-command error path
+    AVAILABLE_COMMANDS = ", ".join(COMMANDS)
+    # Welcome text below the logo, formatted once and printed in one call
+    WELCOME_TEXT = "\n".join([
+        "[cyan]Available commands:[/cyan]",
+        *(f"  [yellow]{cmd:8s}[/yellow] → {desc}" for cmd, desc in COMMANDS.items()),
+        "",
+        "[dim]Examples:[/dim]",
+        "  [dim]explain 'nmap -sV target.local'[/dim]",
+        "  [dim]tip 'SQL injection basics'[/dim]",
+        "  [dim]help 'connection refused'[/dim]",
+        "",
+        "[green]💡 Natural Language Support:[/green]",
+        "  [dim]how do I scan ports?[/dim]",
+        "  [dim]what is nmap?[/dim]",
+        "  [dim]tips on sql injection[/dim]",
+        "  [dim]I'm stuck on this nmap thing[/dim]",
+        "",
+    ])
 
     def __init__(self, session: str | None = None) -> None:
         self.console = Console()
         self.session_name = session
         self.completer = SmartCompleter()
-        self.prompt_session = PromptSession(completer=self.completer)
+        self.prompt_session = PromptSession(
+            completer=self.completer, history=_prompt_history()
+        )
 
     async def run(self) -> None:
         """Run the interactive TUI using prompt_toolkit's async API."""
+        # Overlap the heavy imports and the history file read with
+        # rendering the welcome screen
+        threading.Thread(target=_warm_imports, daemon=True).start()
+        history_loader = threading.Thread(target=_preload_history, daemon=True)
+        history_loader.start()
         self._show_welcome()
+        history_loader.join()
 
-        # Main input loop using prompt_async
-        while True:
-            try:
-                # Use patch_stdout to prevent output corruption
-                with patch_stdout():
-                    text = await self.prompt_session.prompt_async("❯ ", default="")
-                    text = text.strip()
+        try:
+            # Main input loop using prompt_async
+            while True:
+                try:
+                    # Use patch_stdout to prevent output corruption
+                    with patch_stdout():
+                        text = await self.prompt_session.prompt_async("❯ ", default="")
+                        text = text.strip()
 
-                if not text:
-                    continue
+                    if not text:
+                        continue
 
-                if text.lower() in {"exit", "quit"}:
-                    self.console.print("[green]Good luck! Document your steps and be safe.[/green]")
-                    break
+                    if text.lower() in {"exit", "quit"}:
+                        self.console.print(_GOODBYE)
+                        break
 
-                # Process command
-                self._process_command(text)
+                    # Process off the event loop so the loop stays responsive
+                    await asyncio.to_thread(self._process_command, text)
 
-            except (EOFError, KeyboardInterrupt):
-                self.console.print()
-                self.console.print("[green]Good luck! Document your steps and be safe.[/green]")
-                break
-            except Exception as e:
-                self.console.print(f"[red]Error: {e}[/red]")
+                except (EOFError, KeyboardInterrupt):
+                    self.console.print()
+                    self.console.print(_GOODBYE)
+                    break
+                except asyncio.CancelledError:
+                    # Ctrl-C while a command runs in its worker thread cancels
+                    # the task; say goodbye but let the cancellation through
+                    self.console.print()
+                    self.console.print(_GOODBYE)
+                    raise
+                except Exception as e:
+                    self.console.print(f"[red]Error: {e}[/red]")
+        finally:
+            # Buffered history is also written at exit; flushing here covers
+            # hosts that keep the process running after the session ends
+            history_flush()
+            try:
+                get_history().flush()
+            except OSError:
+                pass  # Unwritable history dir; nothing more to do at shutdown
 
     def _show_welcome(self) -> None:
         """Show welcome message."""
         self.console.clear()
         self.console.print()
         
-        # Print colored shield logo with gradient (green to cyan) and medical cross
-        # Matches the SVG design: rgb(0,255,136) → rgb(0,255,255)
-        print("\033[1;38;2;0;255;136m        ▄▀▀▀▄\033[0m")
-        print("\033[1;38;2;0;255;150m       █  │  █\033[0m")
-        print("\033[1;38;2;0;255;170m      █ ──┼── █\033[0m      \033[1;97mCY\033[1;38;2;0;255;255mBUDDY\033[0m")
-        print("\033[1;38;2;0;255;190m      █   │   █\033[0m")
-        print("\033[1;38;2;0;255;210m       █     █\033[0m       \033[2mYour Security Learning Companion\033[0m")
-        print("\033[1;38;2;0;255;230m        █   █\033[0m")
-        print("\033[1;38;2;0;255;245m         █ █\033[0m")
-        print("\033[1;38;2;0;255;255m          ▀\033[0m\n")
-
-        self.console.print("[cyan]Available commands:[/cyan]")
-        for cmd, desc in self.COMMANDS.items():
-            self.console.print(f"  [yellow]{cmd:8s}[/yellow] → {desc}")
+        use_color = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+        sys.stdout.write(_LOGO if use_color else _LOGO_PLAIN)
+        sys.stdout.flush()
 
-        self.console.print()
-        self.console.print("[dim]Examples:[/dim]")
-        self.console.print("  [dim]explain 'nmap -sV target.local'[/dim]")
-        self.console.print("  [dim]tip 'SQL injection basics'[/dim]")
-        self.console.print("  [dim]help 'connection refused'[/dim]")
-        self.console.print()
-        self.console.print("[green]💡 Natural Language Support:[/green]")
-        self.console.print("  [dim]how do I scan ports?[/dim]")
-        self.console.print("  [dim]what is nmap?[/dim]")
-        self.console.print("  [dim]tips on sql injection[/dim]")
-        self.console.print("  [dim]I'm stuck on this nmap thing[/dim]")
-        self.console.print()
+        self.console.print(self.WELCOME_TEXT)
 
     def _process_command(self, text: str) -> None:
         """Process user command with progressive loading feedback."""
-        import shlex
         from ..nl_parser import is_natural_language, parse_natural_query
 
         # Show processing feedback for natural language queries
@@ -209,12 +409,8 @@ class SimpleTUI:
             # Set up for normal command processing
             parts = [cmd, parsed_query]
         else:
-            # Parse command using shlex for proper shell-like parsing
-            try:
-                parts = shlex.split(text)
-            except ValueError:
-                # Fallback for unclosed quotes
-                parts = text.split()
+            # Parse command with shell-like quoting
+            parts = _split_command(text)
 
         if not parts:
             return
@@ -228,7 +424,7 @@ class SimpleTUI:
         self.console.print()
         
         # Show processing feedback for complex operations
-        if cmd in ["explain", "tip", "help", "assist", "report", "quiz", "plan"]:
+        if cmd in _HELPERS:
             with self.console.status(f"[bold green]Processing {cmd} request...", spinner="dots"):
                 self._execute_command(cmd, arg)
         else:
@@ -242,47 +438,13 @@ class SimpleTUI:
 
     def _execute_command(self, cmd: str, arg: str) -> None:
         """Execute a command with the given argument."""
-        if cmd == "explain":
-            if not arg:
-                self.console.print("[red]⚠[/red] Usage: explain '<command>'")
-            else:
-                result = explain_command(arg)
-                self._print_response("Explanation", result)
-
-        elif cmd == "tip":
-            if not arg:
-                self.console.print("[red]⚠[/red] Usage: tip '<topic>'")
-            else:
-                result = quick_tip(arg)
-                self._print_response("Tip", result)
-
-        elif cmd in {"help", "assist"}:
-            if not arg:
-                self.console.print("[red]⚠[/red] Usage: help '<error message>'")
-            else:
-                result = help_troubleshoot(arg)
-                self._print_response("Troubleshooting", result)
-
-        elif cmd == "report":
-            if not arg:
-                self.console.print("[red]⚠[/red] Usage: report '<finding>'")
-            else:
-                result = micro_report(arg)
-                self._print_response("Report Template", result)
-
-        elif cmd == "quiz":
+        helper = _HELPERS.get(cmd)
+        if helper is not None:
+            handler, title, usage = helper
             if not arg:
-                self.console.print("[red]⚠[/red] Usage: quiz '<topic>'")
+                self.console.print(f"[red]⚠[/red] Usage: {usage}")
             else:
-                result = quiz_flashcards(arg)
-                self._print_response("Quiz", result)
-
-        elif cmd == "plan":
-            if not arg:
-                self.console.print("[red]⚠[/red] Usage: plan '<context>'")
-            else:
-                result = step_planner(arg)
-                self._print_response("Next Steps", result)
+                self._print_response(title, handler(arg))
 
         elif cmd == "history":
             self._handle_history_command(arg)
@@ -292,60 +454,18 @@ class SimpleTUI:
 
         else:
             self.console.print(f"[red]⚠[/red] Unknown command: {cmd}")
-            self.console.print("[dim]Available: " + ", ".join(self.COMMANDS.keys()) + "[/dim]")
+            candidates = _COMMAND_PREFIXES.get(cmd, ())
+            if len(candidates) == 1:
+                self.console.print(f"[dim]Did you mean: {candidates[0]}?[/dim]")
+            else:
+                self.console.print(f"[dim]Available: {self.AVAILABLE_COMMANDS}[/dim]")
 
         self.console.print()
 
     def _print_response(self, title: str, content: str) -> None:
         """Print formatted response with README-style borders and syntax highlighting."""
-        from ..formatters import create_syntax_highlight, is_likely_code
-
-        # Top border with title
-        border_len = 50 - len(title)
-        self.console.print(f"[bold yellow]─── {title} {'─' * border_len}[/bold yellow]")
-
-        # Content with 2-space indent and syntax highlighting for code blocks
-        lines = content.split("\n")
-        code_buffer = []
-        in_code_block = False
-
-        for line in lines:
-            # Detect potential code lines (start with common commands or have flags)
-            if is_likely_code(line.strip()) and not in_code_block:
-                in_code_block = True
-                code_buffer = [line]
-            elif in_code_block:
-                # Continue code block if line looks like code or is empty
-                if is_likely_code(line.strip()) or not line.strip():
-                    code_buffer.append(line)
-                else:
-                    # End code block and print it
-                    if code_buffer:
-                        code_text = "\n".join(code_buffer)
-                        syntax = create_syntax_highlight(code_text, line_numbers=False)
-                        self.console.print(syntax)
-                        code_buffer = []
-                    in_code_block = False
-                    # Print current line as regular text
-                    if line.strip():
-                        self.console.print(f"  {line}")
-                    else:
-                        self.console.print()
-            else:
-                # Regular text line
-                if line.strip():
-                    self.console.print(f"  {line}")
-                else:
-                    self.console.print()
-
-        # Print any remaining code buffer
-        if code_buffer:
-            code_text = "\n".join(code_buffer)
-            syntax = create_syntax_highlight(code_text, line_numbers=False)
-            self.console.print(syntax)
-
-        # Bottom border
-        self.console.print("[bold yellow]" + "─" * 60 + "[/bold yellow]")
+        for part in _response_renderables(title, content):
+            self.console.print(part)
 
     def _handle_history_command(self, arg: str) -> None:
         """Handle history command with smart suggestions."""
@@ -387,8 +507,9 @@ class SimpleTUI:
         
         if args[0] == "--search" and len(args) > 1:
             query = " ".join(args[1:])
-            results = history.search(query)
-            if not results:
+            results = history.iter_search(query, newest_first=True)
+            first = next(results, None)
+            if first is None:
                 self.console.print(f"[red]❌ No commands found matching '{query}'.[/red]")
                 
                 # Provide smart suggestions based on query
@@ -399,8 +520,15 @@ class SimpleTUI:
                         self.console.print(f"  [dim]{i}.[/dim] {suggestion}")
                 return
             
-            self.console.print(f"[cyan]🔍 Commands matching '{query}':[/cyan]")
-            for i, cmd in enumerate(results, 1):
+            self.console.print(
+                f"[cyan]🔍 Commands matching '{query}' (most recent first):[/cyan]"
+            )
+            for i, cmd in enumerate(chain((first,), results), 1):
+                if i > SEARCH_LIMIT:
+                    self.console.print(
+                        f"[dim]... showing the {SEARCH_LIMIT} most recent matches[/dim]"
+                    )
+                    break
                 self.console.print(f"  [dim]{i:3d}.[/dim] {cmd}")
             return
         
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from cybuddy.commands.history import cmd_history
+from cybuddy.history import SEARCH_LIMIT, get_history
+
+
+def test_search_keeps_most_recent_matches(capsys: pytest.CaptureFixture[str]) -> None:
+    history = get_history()
+    for i in range(SEARCH_LIMIT + 5):
+        history.add(f"tip {i}")
+
+    assert cmd_history(["--search", "tip"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1] == f"  1. tip {SEARCH_LIMIT + 4}"
+    assert lines[SEARCH_LIMIT] == "200. tip 5"
+    assert lines[-1] == f"... showing the {SEARCH_LIMIT} most recent matches"
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cybuddy import cli, history
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point HOME at tmp_path and drop every cache derived from it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(history, "_history_instance", None)
+    history._data_dir.cache_clear()
+    cli._invalidate_config_cache()
+    yield tmp_path
+    history._data_dir.cache_clear()
+    cli._invalidate_config_cache()
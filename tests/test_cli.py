@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cybuddy import cli
+
+
+def _write_config(home: Path, history_path: Path, mtime_ns: int) -> None:
+    config = home / ".config" / "cybuddy" / "config.yaml"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(f"history:\n  path: {history_path}\n", encoding="utf-8")
+    os.utime(config, ns=(mtime_ns, mtime_ns))
+
+
+def test_history_path_follows_config_edits(isolated_home: Path) -> None:
+    first = isolated_home / "first.jsonl"
+    second = isolated_home / "second.jsonl"
+
+    _write_config(isolated_home, first, 1_000_000_000)
+    assert cli._history_file() == first
+
+    _write_config(isolated_home, second, 2_000_000_000)
+    assert cli.load_config()["history.path"] == str(second)
+    assert cli._history_file() == second
+
+
+def test_config_is_reparsed_only_when_mtime_changes(isolated_home: Path) -> None:
+    _write_config(isolated_home, isolated_home / "a.jsonl", 1_000_000_000)
+    assert cli.load_config() is cli.load_config()
+
+    _write_config(isolated_home, isolated_home / "b.jsonl", 1_000_000_000)
+    assert cli.load_config()["history.path"] == str(isolated_home / "a.jsonl")
+
+
+def test_invalidate_config_cache_rereads_home(
+    isolated_home: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    assert cli._app_dir() == isolated_home / ".cybuddy"
+
+    other_home = tmp_path_factory.mktemp("other-home")
+    monkeypatch.setenv("HOME", str(other_home))
+    assert cli._app_dir() == isolated_home / ".cybuddy"
+
+    cli._invalidate_config_cache()
+    assert cli._app_dir() == other_home / ".cybuddy"
+    default_log = other_home / ".local" / "share" / "cybuddy" / "history.jsonl"
+    assert cli._history_file() == default_log
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cybuddy.history import CommandEntry, SmartHistory
+
+
+def _log_lines(h: SmartHistory) -> list[dict[str, object]]:
+    return [json.loads(line) for line in h.history_file.read_bytes().splitlines()]
+
+
+def test_add_appends_to_log_and_reloads() -> None:
+    h = SmartHistory()
+    h.add("explain nmap")
+    h.add("tip xss")
+    h.flush()
+
+    assert [e["command"] for e in _log_lines(h)] == ["explain nmap", "tip xss"]
+    assert SmartHistory().get_history() == ["explain nmap", "tip xss"]
+
+
+def test_frequency_bump_is_folded_on_load() -> None:
+    h = SmartHistory()
+    h.add("explain nmap")
+    h.add("explain nmap")
+    h.add("explain nmap")
+    h.flush()
+
+    assert len(_log_lines(h)) == 3
+    entries = SmartHistory().get_enhanced_history()
+    assert [(e.command, e.frequency) for e in entries] == [("explain nmap", 3)]
+
+
+def test_corrupt_lines_are_skipped() -> None:
+    h = SmartHistory()
+    h.add("explain nmap")
+    h.add("tip xss")
+    h.flush()
+    with open(h.history_file, "ab") as f:
+        f.write(b'{"command": "truncat')
+
+    lines = h.history_file.read_bytes().splitlines()
+    h.history_file.write_bytes(b"\n".join([lines[0], b"not json", *lines[1:]]))
+
+    assert SmartHistory().get_history() == ["explain nmap", "tip xss"]
+
+
+def test_log_is_compacted_past_limit() -> None:
+    h = SmartHistory(max_size=4)
+    h.SAVE_EVERY = 1
+    for i in range(h.COMPACT_FACTOR * h.max_size + 1):
+        h.add(f"tip {i}")
+
+    assert [e["command"] for e in _log_lines(h)] == ["tip 5", "tip 6", "tip 7", "tip 8"]
+    assert SmartHistory(max_size=4).get_history() == h.get_history()
+
+
+def test_legacy_history_is_migrated(isolated_home: Path) -> None:
+    h = SmartHistory()
+    h.legacy_history_file.parent.mkdir(parents=True)
+    entry = CommandEntry("explain nmap", "2024-01-01T00:00:00", 2, "explain")
+    h.legacy_history_file.write_text(
+        json.dumps({"commands": [entry._asdict()]}), encoding="utf-8"
+    )
+
+    assert h.get_enhanced_history() == [entry]
+    assert [CommandEntry(**e) for e in _log_lines(h)] == [entry]
+
+
+def test_legacy_migration_tolerates_read_only_dir(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    h = SmartHistory()
+    h.legacy_history_file.parent.mkdir(parents=True)
+    h.legacy_history_file.write_text(
+        json.dumps({"commands": ["explain nmap"]}), encoding="utf-8"
+    )
+
+    def read_only() -> None:
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(h, "save", read_only)
+
+    assert h.get_history() == ["explain nmap"]
+    assert not h.history_file.exists()
+    assert h.legacy_history_file.exists()
+
+
+def test_iter_search_newest_first() -> None:
+    h = SmartHistory()
+    for cmd in ("tip xss", "explain nmap", "tip sqli"):
+        h.add(cmd)
+
+    assert list(h.iter_search("tip")) == ["tip xss", "tip sqli"]
+    assert list(h.iter_search("tip", newest_first=True)) == ["tip sqli", "tip xss"]
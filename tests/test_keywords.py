@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pytest
+
+from cybuddy._keywords import compile_keyword_table, find_labels
+
+
+def test_find_labels_reports_every_label_present() -> None:
+    pattern = compile_keyword_table({"scan": ("nmap", "port"), "web": ("http", "xss")})
+    assert find_labels(pattern, "nmap -p 80 http://host") == {"scan", "web"}
+    assert find_labels(pattern, "reported xss") == {"scan", "web"}
+    assert find_labels(pattern, "hashcat") == frozenset()
+
+
+def test_prefix_within_a_label_is_allowed() -> None:
+    pattern = compile_keyword_table({"crypto": ("hash", "hashcat"), "web": ("http",)})
+    assert find_labels(pattern, "hashcat http") == {"crypto", "web"}
+
+
+def test_prefix_across_labels_is_rejected() -> None:
+    with pytest.raises(ValueError, match="'scan' \\(scan\\) is a prefix of 'scanner'"):
+        compile_keyword_table({"scan": ("scan",), "tool": ("scanner",)})
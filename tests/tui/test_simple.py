@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from rich.console import Console
+
+from cybuddy.tui import simple
+from cybuddy.tui.simple import SimpleTUI, _build_prefix_index, _split_command
+
+
+def test_prefix_index_maps_every_prefix_in_order() -> None:
+    index = _build_prefix_index(("help", "history", "hint"))
+    assert index["h"] == ("help", "history", "hint")
+    assert index["hi"] == ("history", "hint")
+    assert index["hel"] == ("help",)
+    assert index["history"] == ("history",)
+    assert "x" not in index
+
+
+def test_command_prefixes_cover_every_command() -> None:
+    for name in simple._COMMAND_NAMES:
+        assert name in simple._COMMAND_PREFIXES[name]
+    assert simple._COMMAND_PREFIXES["ex"] == ("explain", "exit")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "explain nmap",
+        "  tip   sql injection  ",
+        'explain "nmap -sV"',
+        "plan 'found open port 80'",
+        'report "a" b',
+        r"help permission\ denied",
+        "",
+    ],
+)
+def test_split_command_matches_shlex(text: str) -> None:
+    import shlex
+
+    assert _split_command(text) == shlex.split(text)
+
+
+def _tui() -> tuple[SimpleTUI, Console]:
+    tui = SimpleTUI.__new__(SimpleTUI)
+    tui.console = Console(record=True, width=200)
+    return tui, tui.console
+
+
+def test_unknown_command_suggests_unambiguous_prefix() -> None:
+    tui, console = _tui()
+    tui._execute_command("expl", "")
+    output = console.export_text()
+    assert "Unknown command: expl" in output
+    assert "Did you mean: explain?" in output
+
+
+def test_unknown_command_lists_commands_for_ambiguous_prefix() -> None:
+    tui, console = _tui()
+    tui._execute_command("ex", "")
+    output = console.export_text()
+    assert "Did you mean" not in output
+    assert f"Available: {SimpleTUI.AVAILABLE_COMMANDS}" in output
+
+
+def test_cancelling_run_propagates_and_flushes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    flushed: list[bool] = []
+
+    def slow_command(self: SimpleTUI, text: str) -> None:
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(SimpleTUI, "_process_command", slow_command)
+    monkeypatch.setattr(SimpleTUI, "_show_welcome", lambda self: None)
+    monkeypatch.setattr(simple, "history_flush", lambda: flushed.append(True))
+
+    async def main() -> asyncio.Task[None]:
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("explain nmap\n")
+            tui = SimpleTUI()
+            tui.console = Console(record=True, width=200)
+            task = asyncio.create_task(tui.run())
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                release.set()
+            assert "Good luck!" in tui.console.export_text()
+            return task
+
+    task = asyncio.run(main())
+    assert task.cancelled()
+    assert flushed == [True]